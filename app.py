@@ -668,7 +668,6 @@ Always be helpful, professional, and data-driven. Format responses clearly with
                     
                     for tool_call in assistant_message.tool_calls:
                         tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
                         
                         # Show which tool is being used
                         tool_display_names = {
@@ -687,7 +686,7 @@ Always be helpful, professional, and data-driven. Format responses clearly with
                         st.write(tool_display_names.get(tool_name, f"🔧 Using {tool_name}..."))
                         
                         # Execute tool
-                        result = ToolExecutor.execute(tool_name, tool_args)
+                        result = ToolExecutor.execute_json(tool_name, tool_call.function.arguments)
                         
                         # Check for images
                         if result.get("has_image") and result.get("image_base64"):
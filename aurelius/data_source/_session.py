@@ -0,0 +1,15 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared by the data-source utilities so connections to each API host are
+# kept alive and reused across calls instead of reconnecting every time
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
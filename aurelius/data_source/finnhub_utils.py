@@ -7,7 +7,16 @@ from typing import Annotated
 from collections import defaultdict
 from functools import wraps
 from datetime import datetime
-from ..utils import decorate_all_methods, save_output, SavePathType
+from ..utils import (
+    decorate_all_methods,
+    cache_methods,
+    DataFetchError,
+    save_output,
+    SavePathType,
+    NEWS_TTL,
+    FUNDAMENTALS_TTL,
+    PROFILE_TTL,
+)
 
 
 def init_finnhub_client(func):
@@ -22,12 +31,30 @@ def init_finnhub_client(func):
         else:
             finnhub_client = finnhub.Client(api_key=os.environ["FINNHUB_API_KEY"])
             print("Finnhub client initialized")
-            return func(*args, **kwargs)
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                raise DataFetchError(f"{func.__name__} failed: {e}") from e
 
     # wrapper.__annotations__ = func.__annotations__
     return wrapper
 
 
+def _is_finnhub_result(value) -> bool:
+    # Failed lookups come back as "Failed to find ..." messages; don't keep them
+    if value is None or (isinstance(value, str) and value.startswith("Failed")):
+        return False
+    return not (isinstance(value, pd.DataFrame) and value.empty)
+
+
+@cache_methods(
+    {
+        "get_company_profile": PROFILE_TTL,
+        "get_basic_financials": FUNDAMENTALS_TTL,
+        "get_company_news": NEWS_TTL,
+    },
+    cacheable=_is_finnhub_result,
+)
 @decorate_all_methods(init_finnhub_client)
 class FinnHubUtils:
 
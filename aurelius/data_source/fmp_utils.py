@@ -1,13 +1,14 @@
 import os
-import requests
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from ..utils import decorate_all_methods, get_next_weekday
+from ..utils import decorate_all_methods, get_next_weekday, cache_methods, FUNDAMENTALS_TTL
+from ._session import SESSION
 
 # from aurelius.utils import decorate_all_methods, get_next_weekday
 from functools import wraps
 from typing import Annotated, List
+from concurrent.futures import ThreadPoolExecutor
 
 
 def init_fmp_api(func):
@@ -25,6 +26,23 @@ def init_fmp_api(func):
     return wrapper
 
 
+def _get_statement_data(symbol: str, years: int):
+    """Fetch the income statement, key metrics and ratios of a symbol concurrently"""
+    base_url = "https://financialmodelingprep.com/api/v3"
+    urls = [
+        f"{base_url}/{endpoint}/{symbol}?limit={years}&apikey={fmp_api_key}"
+        for endpoint in ("income-statement", "key-metrics", "ratios")
+    ]
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(lambda url: SESSION.get(url).json(), urls))
+
+
+def _is_sec_report(value) -> bool:
+    # Only keep lookups that found a filing, not error messages
+    return isinstance(value, str) and value.startswith("Link: ")
+
+
+@cache_methods({"get_sec_report": FUNDAMENTALS_TTL}, cacheable=_is_sec_report)
 @decorate_all_methods(init_fmp_api)
 class FMPUtils:
 
@@ -38,7 +56,7 @@ class FMPUtils:
 
         # 发送GET请求
         price_target = "Not Given"
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # 确保请求成功
         if response.status_code == 200:
@@ -75,7 +93,7 @@ class FMPUtils:
 
         # 发送GET请求
         filing_url = None
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # 确保请求成功
         if response.status_code == 200:
@@ -106,7 +124,7 @@ class FMPUtils:
 
         # 发送GET请求
         mkt_cap = None
-        response = requests.get(url)
+        response = SESSION.get(url)
 
         # 确保请求成功
         if response.status_code == 200:
@@ -124,7 +142,7 @@ class FMPUtils:
         """Get the historical book value per share for a given stock on a given date"""
         # 从FMP API获取历史关键财务指标数据
         url = f"https://financialmodelingprep.com/api/v3/key-metrics/{ticker_symbol}?limit=40&apikey={fmp_api_key}"
-        response = requests.get(url)
+        response = SESSION.get(url)
         data = response.json()
 
         if not data:
@@ -151,25 +169,14 @@ class FMPUtils:
         years: Annotated[int, "number of the years to search from, default to 4"] = 4
     ) -> pd.DataFrame:
         """Get the financial metrics for a given stock for the last 'years' years"""
-        # Base URL setup for FMP API
-        base_url = "https://financialmodelingprep.com/api/v3"
         # Create DataFrame
         df = pd.DataFrame()
 
+        # The responses cover all the years, so they are requested once
+        income_data, key_metrics_data, ratios_data = _get_statement_data(ticker_symbol, years)
+
         # Iterate over the last 'years' years of data
         for year_offset in range(years):
-            # Construct URL for income statement and ratios for each year
-            income_statement_url = f"{base_url}/income-statement/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-            ratios_url = (
-                f"{base_url}/ratios/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-            )
-            key_metrics_url = f"{base_url}/key-metrics/{ticker_symbol}?limit={years}&apikey={fmp_api_key}"
-
-            # Requesting data from the API
-            income_data = requests.get(income_statement_url).json()
-            key_metrics_data = requests.get(key_metrics_url).json()
-            ratios_data = requests.get(ratios_url).json()
-
             # Extracting needed metrics for each year
             if income_data and key_metrics_data and ratios_data:
                 metrics = {
@@ -203,20 +210,15 @@ class FMPUtils:
         years: Annotated[int, "number of the years to search from, default to 4"] = 4
     ) -> dict:
         """Get financial metrics for the company and its competitors."""
-        base_url = "https://financialmodelingprep.com/api/v3"
         all_data = {}
 
         symbols = [ticker_symbol] + competitors  # Combine company and competitors into one list
-    
-        for symbol in symbols:
-            income_statement_url = f"{base_url}/income-statement/{symbol}?limit={years}&apikey={fmp_api_key}"
-            ratios_url = f"{base_url}/ratios/{symbol}?limit={years}&apikey={fmp_api_key}"
-            key_metrics_url = f"{base_url}/key-metrics/{symbol}?limit={years}&apikey={fmp_api_key}"
 
-            income_data = requests.get(income_statement_url).json()
-            ratios_data = requests.get(ratios_url).json()
-            key_metrics_data = requests.get(key_metrics_url).json()
+        # Each endpoint takes one symbol, so the symbols are fetched side by side
+        with ThreadPoolExecutor(max_workers=len(symbols)) as executor:
+            statement_data = list(executor.map(lambda symbol: _get_statement_data(symbol, years), symbols))
 
+        for symbol, (income_data, key_metrics_data, ratios_data) in zip(symbols, statement_data):
             metrics = {}
 
             if income_data and ratios_data and key_metrics_data:
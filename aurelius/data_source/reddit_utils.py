@@ -2,11 +2,23 @@ import os
 import praw
 import pandas as pd
 from typing import Annotated, List
-from functools import wraps
+from functools import lru_cache, wraps
 from datetime import datetime, timezone
 from ..utils import decorate_all_methods, save_output, SavePathType
 
 
+@lru_cache(maxsize=1)
+def _get_reddit_client(client_id: str, client_secret: str) -> praw.Reddit:
+    # One client per set of credentials, so its HTTP session and token are reused across calls
+    client = praw.Reddit(
+        client_id=client_id,
+        client_secret=client_secret,
+        user_agent="python:aurelius:v1.0 (by /u/aurelius)",
+    )
+    print("Reddit client initialized")
+    return client
+
+
 def init_reddit_client(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -17,12 +29,9 @@ def init_reddit_client(func):
             print("Please set the environment variables for Reddit API credentials.")
             return None
         else:
-            reddit_client = praw.Reddit(
-                client_id=os.environ["REDDIT_CLIENT_ID"],
-                client_secret=os.environ["REDDIT_CLIENT_SECRET"],
-                user_agent="python:aurelius:v1.0 (by /u/aurelius)",
+            reddit_client = _get_reddit_client(
+                os.environ["REDDIT_CLIENT_ID"], os.environ["REDDIT_CLIENT_SECRET"]
             )
-            print("Reddit client initialized")
             return func(*args, **kwargs)
 
     return wrapper
@@ -1,16 +1,21 @@
 import os
-import requests
 from sec_api import ExtractorApi, QueryApi, RenderApi
 from functools import wraps
-from typing import Annotated
+from typing import Annotated, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 from ..utils import SavePathType, decorate_all_methods
 from ..data_source import FMPUtils
+from ._session import SESSION
 
 
 CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
 PDF_GENERATOR_API = "https://api.sec-api.io/filing-reader"
 
 
+def _section_cache_path(ticker_symbol, fyear, section) -> str:
+    return os.path.join(CACHE_PATH, f"sec_utils/{ticker_symbol}_{fyear}_{section}.txt")
+
+
 def init_sec_api(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -123,7 +128,7 @@ class SECUtils:
                     os.makedirs(save_folder)
 
                 api_url = f"{PDF_GENERATOR_API}?token={os.environ['SEC_API_KEY']}&type=pdf&url={filing_url}"
-                response = requests.get(api_url, stream=True)
+                response = SESSION.get(api_url, stream=True)
                 response.raise_for_status()
 
                 file_path = os.path.join(save_folder, file_name)
@@ -180,9 +185,7 @@ class SECUtils:
             else:
                 return report_address  # debug info
 
-        cache_path = os.path.join(
-            CACHE_PATH, f"sec_utils/{ticker_symbol}_{fyear}_{section}.txt"
-        )
+        cache_path = _section_cache_path(ticker_symbol, fyear, section)
         if os.path.exists(cache_path):
             with open(cache_path, "r") as f:
                 section_text = f.read()
@@ -198,3 +201,74 @@ class SECUtils:
                 f.write(section_text)
 
         return section_text
+
+    def get_10k_sections(
+        ticker_symbol: Annotated[str, "ticker symbol"],
+        fyear: Annotated[str, "fiscal year of the 10-K report"],
+        sections: Annotated[
+            List[str | int],
+            "Sections of the 10-K report to extract, each in [1, 1A, 1B, 2, 3, 4, 5, 6, 7, 7A, 8, 9, 9A, 9B, 10, 11, 12, 13, 14, 15]",
+        ],
+        report_address: Annotated[
+            str,
+            "URL of the 10-K report, if not specified, will get report url from fmp api",
+        ] = None,
+    ) -> Dict[str, str]:
+        """
+        Get several sections of a 10-K report from the SEC API, keyed by section.
+        The report url is looked up once and the sections are fetched concurrently.
+        """
+        if not sections:
+            return {}
+
+        if report_address is None:
+            report_address = FMPUtils.get_sec_report(ticker_symbol, fyear)
+            if report_address.startswith("Link: "):
+                report_address = report_address.lstrip("Link: ").split()[0]
+            else:
+                return {str(section): report_address for section in sections}  # debug info
+
+        with ThreadPoolExecutor(max_workers=len(sections)) as executor:
+            texts = executor.map(
+                lambda section: SECUtils.get_10k_section(
+                    ticker_symbol, fyear, section, report_address
+                ),
+                sections,
+            )
+            return {str(section): text for section, text in zip(sections, texts)}
+
+    def get_10k_section_preview(
+        ticker_symbol: Annotated[str, "ticker symbol"],
+        fyear: Annotated[str, "fiscal year of the 10-K report"],
+        section: Annotated[
+            str | int,
+            "Section of the 10-K report, should be in [1, 1A, 1B, 2, 3, 4, 5, 6, 7, 7A, 8, 9, 9A, 9B, 10, 11, 12, 13, 14, 15]",
+        ],
+        n: Annotated[int, "number of characters to return, default to 100"] = 100,
+    ) -> str:
+        """
+        Get the first n characters of a 10-K report section.
+        Once the section is cached, only those characters are read from disk.
+        """
+        cache_path = _section_cache_path(ticker_symbol, fyear, section)
+        if not os.path.exists(cache_path):
+            return SECUtils.get_10k_section(ticker_symbol, fyear, section)[:n]
+        with open(cache_path, "r") as f:
+            return f.read(n)
+
+    def get_10k_section_length(
+        ticker_symbol: Annotated[str, "ticker symbol"],
+        fyear: Annotated[str, "fiscal year of the 10-K report"],
+        section: Annotated[
+            str | int,
+            "Section of the 10-K report, should be in [1, 1A, 1B, 2, 3, 4, 5, 6, 7, 7A, 8, 9, 9A, 9B, 10, 11, 12, 13, 14, 15]",
+        ],
+    ) -> int:
+        """
+        Get the size in bytes of a 10-K report section's text.
+        Once the section is cached, this is read from the file size.
+        """
+        cache_path = _section_cache_path(ticker_symbol, fyear, section)
+        if not os.path.exists(cache_path):
+            return len(SECUtils.get_10k_section(ticker_symbol, fyear, section).encode())
+        return os.stat(cache_path).st_size
@@ -1,9 +1,19 @@
 import yfinance as yf
-from typing import Annotated, Callable, Any, Optional
+from typing import Annotated, Callable, Any, List, Optional
 from pandas import DataFrame
 from functools import wraps
 
-from ..utils import save_output, SavePathType, decorate_all_methods
+from ..utils import (
+    save_output,
+    SavePathType,
+    decorate_all_methods,
+    cache_methods,
+    ttl_cache,
+    DataFetchError,
+    PRICE_TTL,
+    HISTORY_TTL,
+    FUNDAMENTALS_TTL,
+)
 
 
 def init_ticker(func: Callable) -> Callable:
@@ -12,11 +22,23 @@ def init_ticker(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(symbol: Annotated[str, "ticker symbol"], *args, **kwargs) -> Any:
         ticker = yf.Ticker(symbol)
-        return func(ticker, *args, **kwargs)
+        try:
+            return func(ticker, *args, **kwargs)
+        except Exception as e:
+            raise DataFetchError(f"{func.__name__} failed for {symbol}: {e}") from e
 
     return wrapper
 
 
+@cache_methods(
+    {
+        "get_stock_data": PRICE_TTL,
+        "get_stock_info": PRICE_TTL,
+        "get_income_stmt": FUNDAMENTALS_TTL,
+        "get_balance_sheet": FUNDAMENTALS_TTL,
+        "get_cash_flow": FUNDAMENTALS_TTL,
+    }
+)
 @decorate_all_methods(init_ticker)
 class YFinanceUtils:
 
@@ -111,6 +133,31 @@ class YFinanceUtils:
         return majority_voting_result[0], max_votes
 
 
+@ttl_cache(HISTORY_TTL, "YFinanceUtils.get_multi_stock_data")
+def get_multi_stock_data(
+    symbols: Annotated[List[str], "ticker symbols"],
+    start_date: Annotated[
+        str, "start date for retrieving stock price data, YYYY-mm-dd"
+    ],
+    end_date: Annotated[
+        str, "end date for retrieving stock price data, YYYY-mm-dd"
+    ],
+) -> DataFrame:
+    """retrieve stock price data for several ticker symbols in one batched download, columns grouped by ticker"""
+    return yf.download(
+        list(symbols),
+        start=start_date,
+        end=end_date,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+
+
+# Takes a list of symbols rather than a single ticker, so it is attached after
+# decorate_all_methods has wrapped the per-ticker methods
+YFinanceUtils.get_multi_stock_data = staticmethod(get_multi_stock_data)
+
 if __name__ == "__main__":
     print(YFinanceUtils.get_stock_data("AAPL", "2021-01-01", "2021-12-31"))
     # print(YFinanceUtils.get_stock_data())
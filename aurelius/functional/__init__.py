@@ -1,13 +1,46 @@
-from .analyzer import ReportAnalysisUtils
-from .charting import MplFinanceUtils, ReportChartUtils, ComparisonCharts, EarningsCharts, OwnershipCharts, DCFCharts, RiskCharts
-from .coding import CodingUtils, IPythonUtils
-from .quantitative import BackTraderUtils
-from .reportlab import ReportLabUtils
-from .text import TextUtils
-from .rag import get_rag_function
-from .comparison import StockComparator
-from .earnings import EarningsIntel
-from .ownership import OwnershipIntel
-from .dcf import DCFModel
-from .risk import RiskAnalytics
-from .storage import WatchlistManager, ResearchManager, AlertManager, get_watchlist_manager, get_research_manager
+import importlib
+from typing import Any
+
+# Submodules pull in heavy dependencies (mplfinance, backtrader, autogen, ...),
+# so each is only imported when one of its names is first used (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "ReportAnalysisUtils": ".analyzer",
+    "MplFinanceUtils": ".charting",
+    "ReportChartUtils": ".charting",
+    "ComparisonCharts": ".charting",
+    "EarningsCharts": ".charting",
+    "OwnershipCharts": ".charting",
+    "DCFCharts": ".charting",
+    "RiskCharts": ".charting",
+    "CodingUtils": ".coding",
+    "IPythonUtils": ".coding",
+    "BackTraderUtils": ".quantitative",
+    "ReportLabUtils": ".reportlab",
+    "TextUtils": ".text",
+    "get_rag_function": ".rag",
+    "StockComparator": ".comparison",
+    "EarningsIntel": ".earnings",
+    "OwnershipIntel": ".ownership",
+    "DCFModel": ".dcf",
+    "RiskAnalytics": ".risk",
+    "WatchlistManager": ".storage",
+    "ResearchManager": ".storage",
+    "AlertManager": ".storage",
+    "get_watchlist_manager": ".storage",
+    "get_research_manager": ".storage",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
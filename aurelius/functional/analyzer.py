@@ -1,6 +1,6 @@
 import os
 from textwrap import dedent
-from typing import Annotated, List
+from typing import IO, Annotated, List
 from datetime import timedelta, datetime
 from ..data_source import YFinanceUtils, SECUtils, FMPUtils
 
@@ -13,7 +13,11 @@ def combine_prompt(instruction, resource, table_str=None):
     return prompt
 
 
-def save_to_file(data: str, file_path: str):
+def save_to_file(data: str, file_path: str | IO[str]):
+    # Callers that only want the text can pass an in-memory buffer
+    if hasattr(file_path, "write"):
+        file_path.write(data)
+        return
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
     with open(file_path, "w") as f:
         f.write(data)
@@ -21,15 +25,8 @@ def save_to_file(data: str, file_path: str):
 
 class ReportAnalysisUtils:
 
-    def analyze_income_stmt(
-        ticker_symbol: Annotated[str, "ticker symbol"],
-        fyear: Annotated[str, "fiscal year of the 10-K report"],
-        save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
-    ) -> str:
-        """
-        Retrieve the income statement for the given ticker symbol with the related section of its 10-K report.
-        Then return with an instruction on how to analyze the income statement.
-        """
+    def _build_income_stmt_prompt(ticker_symbol: str, fyear: str) -> str:
+        """Instruction & resources text for analyze_income_stmt, without writing it anywhere"""
         # Retrieve the income statement
         income_stmt = YFinanceUtils.get_income_stmt(ticker_symbol)
         df_string = "Income statement:\n" + income_stmt.to_string().strip()
@@ -54,20 +51,23 @@ class ReportAnalysisUtils:
         section_text = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
 
         # Combine the instruction, section text, and income statement
-        prompt = combine_prompt(instruction, section_text, df_string)
+        return combine_prompt(instruction, section_text, df_string)
 
-        save_to_file(prompt, save_path)
-        return f"instruction & resources saved to {save_path}"
-
-    def analyze_balance_sheet(
+    def analyze_income_stmt(
         ticker_symbol: Annotated[str, "ticker symbol"],
         fyear: Annotated[str, "fiscal year of the 10-K report"],
         save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
     ) -> str:
         """
-        Retrieve the balance sheet for the given ticker symbol with the related section of its 10-K report.
-        Then return with an instruction on how to analyze the balance sheet.
+        Retrieve the income statement for the given ticker symbol with the related section of its 10-K report.
+        Then return with an instruction on how to analyze the income statement.
         """
+        prompt = ReportAnalysisUtils._build_income_stmt_prompt(ticker_symbol, fyear)
+        save_to_file(prompt, save_path)
+        return f"instruction & resources saved to {save_path}"
+
+    def _build_balance_sheet_prompt(ticker_symbol: str, fyear: str) -> str:
+        """Instruction & resources text for analyze_balance_sheet, without writing it anywhere"""
         balance_sheet = YFinanceUtils.get_balance_sheet(ticker_symbol)
         df_string = "Balance sheet:\n" + balance_sheet.to_string().strip()
 
@@ -84,19 +84,23 @@ class ReportAnalysisUtils:
         )
 
         section_text = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
-        prompt = combine_prompt(instruction, section_text, df_string)
-        save_to_file(prompt, save_path)
-        return f"instruction & resources saved to {save_path}"
+        return combine_prompt(instruction, section_text, df_string)
 
-    def analyze_cash_flow(
+    def analyze_balance_sheet(
         ticker_symbol: Annotated[str, "ticker symbol"],
         fyear: Annotated[str, "fiscal year of the 10-K report"],
         save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
     ) -> str:
         """
-        Retrieve the cash flow statement for the given ticker symbol with the related section of its 10-K report.
-        Then return with an instruction on how to analyze the cash flow statement.
+        Retrieve the balance sheet for the given ticker symbol with the related section of its 10-K report.
+        Then return with an instruction on how to analyze the balance sheet.
         """
+        prompt = ReportAnalysisUtils._build_balance_sheet_prompt(ticker_symbol, fyear)
+        save_to_file(prompt, save_path)
+        return f"instruction & resources saved to {save_path}"
+
+    def _build_cash_flow_prompt(ticker_symbol: str, fyear: str) -> str:
+        """Instruction & resources text for analyze_cash_flow, without writing it anywhere"""
         cash_flow = YFinanceUtils.get_cash_flow(ticker_symbol)
         df_string = "Cash flow statement:\n" + cash_flow.to_string().strip()
 
@@ -113,19 +117,23 @@ class ReportAnalysisUtils:
         )
 
         section_text = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
-        prompt = combine_prompt(instruction, section_text, df_string)
-        save_to_file(prompt, save_path)
-        return f"instruction & resources saved to {save_path}"
+        return combine_prompt(instruction, section_text, df_string)
 
-    def analyze_segment_stmt(
+    def analyze_cash_flow(
         ticker_symbol: Annotated[str, "ticker symbol"],
         fyear: Annotated[str, "fiscal year of the 10-K report"],
         save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
     ) -> str:
         """
-        Retrieve the income statement and the related section of its 10-K report for the given ticker symbol.
-        Then return with an instruction on how to create a segment analysis.
+        Retrieve the cash flow statement for the given ticker symbol with the related section of its 10-K report.
+        Then return with an instruction on how to analyze the cash flow statement.
         """
+        prompt = ReportAnalysisUtils._build_cash_flow_prompt(ticker_symbol, fyear)
+        save_to_file(prompt, save_path)
+        return f"instruction & resources saved to {save_path}"
+
+    def _build_segment_stmt_prompt(ticker_symbol: str, fyear: str) -> str:
+        """Instruction & resources text for analyze_segment_stmt, without writing it anywhere"""
         income_stmt = YFinanceUtils.get_income_stmt(ticker_symbol)
         df_string = (
             "Income statement (Segment Analysis):\n" + income_stmt.to_string().strip()
@@ -145,7 +153,18 @@ class ReportAnalysisUtils:
             """
         )
         section_text = SECUtils.get_10k_section(ticker_symbol, fyear, 7)
-        prompt = combine_prompt(instruction, section_text, df_string)
+        return combine_prompt(instruction, section_text, df_string)
+
+    def analyze_segment_stmt(
+        ticker_symbol: Annotated[str, "ticker symbol"],
+        fyear: Annotated[str, "fiscal year of the 10-K report"],
+        save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
+    ) -> str:
+        """
+        Retrieve the income statement and the related section of its 10-K report for the given ticker symbol.
+        Then return with an instruction on how to create a segment analysis.
+        """
+        prompt = ReportAnalysisUtils._build_segment_stmt_prompt(ticker_symbol, fyear)
         save_to_file(prompt, save_path)
         return f"instruction & resources saved to {save_path}"
 
@@ -183,15 +202,8 @@ class ReportAnalysisUtils:
         save_to_file(prompt, save_path)
         return f"instruction & resources saved to {save_path}"
 
-    def get_risk_assessment(
-        ticker_symbol: Annotated[str, "ticker symbol"],
-        fyear: Annotated[str, "fiscal year of the 10-K report"],
-        save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
-    ) -> str:
-        """
-        Retrieve the risk factors for the given ticker symbol with the related section of its 10-K report.
-        Then return with an instruction on how to summarize the top 3 key risks of the company.
-        """
+    def _build_risk_assessment_prompt(ticker_symbol: str, fyear: str) -> str:
+        """Instruction & resources text for get_risk_assessment, without writing it anywhere"""
         company_name = YFinanceUtils.get_stock_info(ticker_symbol)["shortName"]
         risk_factors = SECUtils.get_10k_section(ticker_symbol, fyear, "1A")
         section_text = (
@@ -214,7 +226,18 @@ class ReportAnalysisUtils:
             Finally, provide a detailed and nuanced assessment that reflects the true risk landscape of the company. And Avoid any bullet points in your response.
             """
         )
-        prompt = combine_prompt(instruction, section_text, "")
+        return combine_prompt(instruction, section_text, "")
+
+    def get_risk_assessment(
+        ticker_symbol: Annotated[str, "ticker symbol"],
+        fyear: Annotated[str, "fiscal year of the 10-K report"],
+        save_path: Annotated[str, "txt file path, to which the returned instruction & resources are written."]
+    ) -> str:
+        """
+        Retrieve the risk factors for the given ticker symbol with the related section of its 10-K report.
+        Then return with an instruction on how to summarize the top 3 key risks of the company.
+        """
+        prompt = ReportAnalysisUtils._build_risk_assessment_prompt(ticker_symbol, fyear)
         save_to_file(prompt, save_path)
         return f"instruction & resources saved to {save_path}"
         
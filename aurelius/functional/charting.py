@@ -6,11 +6,24 @@ import pandas as pd
 import numpy as np
 
 from matplotlib import pyplot as plt
-from typing import Annotated, List, Tuple
+from typing import IO, Annotated, List, Tuple
 from pandas import DateOffset
 from datetime import datetime, timedelta
 
 from ..data_source.yfinance_utils import YFinanceUtils
+from ..utils import FUNDAMENTALS_TTL, chart_cache
+
+# Lighter zlib level for PNG output; PNG encoding dominates savefig time.
+# Pillow's PNG writer has no option for the row filter, so only the level is set
+_PNG_SAVE_KWARGS = {"pil_kwargs": {"compress_level": 3}}
+
+
+def _savefig_kwargs(save_path) -> dict:
+    """mplfinance savefig options for save_path; the PIL options only apply to PNG"""
+    # Buffers and paths without an extension are written as PNG, matplotlib's default
+    if isinstance(save_path, str) and os.path.splitext(save_path)[1].lower() not in ("", ".png"):
+        return {"fname": save_path}
+    return {"fname": save_path, **_PNG_SAVE_KWARGS}
 
 
 class MplFinanceUtils:
@@ -55,6 +68,66 @@ class MplFinanceUtils:
         if verbose:
             print(stock_data.to_string())
 
+        return MplFinanceUtils._plot_price_data(
+            stock_data,
+            ticker_symbol,
+            save_path,
+            type=type,
+            style=style,
+            mav=mav,
+            show_nontrading=show_nontrading,
+        )
+
+    @staticmethod
+    def plot_stock_price_chart_from_df(
+        stock_data: Annotated[
+            pd.DataFrame, "OHLCV price history, as returned by YFinanceUtils.get_stock_data"
+        ],
+        ticker_symbol: Annotated[
+            str, "Ticker symbol of the stock, used in the chart title"
+        ],
+        save_path: Annotated[str, "File path where the plot should be saved"],
+        type: Annotated[
+            str,
+            "Type of the plot, should be one of 'candle','ohlc','line','renko','pnf','hollow_and_filled'. Default to 'candle'",
+        ] = "candle",
+        style: Annotated[
+            str,
+            "Style of the plot, should be one of 'default','classic','charles','yahoo','nightclouds','sas','blueskies','mike'. Default to 'default'.",
+        ] = "default",
+        mav: Annotated[
+            int | List[int] | Tuple[int, ...] | None,
+            "Moving average window(s) to plot on the chart. Default to None.",
+        ] = None,
+        show_nontrading: Annotated[
+            bool, "Whether to show non-trading days on the chart. Default to False."
+        ] = False,
+    ) -> str:
+        """
+        Plot a stock price chart using mplfinance from already fetched price data,
+        so several chart types can be drawn from one download.
+        """
+        return MplFinanceUtils._plot_price_data(
+            stock_data,
+            ticker_symbol,
+            save_path,
+            type=type,
+            style=style,
+            mav=mav,
+            show_nontrading=show_nontrading,
+        )
+
+    @staticmethod
+    def _plot_price_data(
+        stock_data: pd.DataFrame,
+        ticker_symbol: str,
+        save_path: str | IO[bytes],
+        type: str = "candle",
+        style: str = "default",
+        mav: int | List[int] | Tuple[int, ...] | None = None,
+        show_nontrading: bool = False,
+    ) -> str:
+        """Draw the mplfinance chart into save_path, a file path or a binary buffer"""
         params = {
             "type": type,
             "style": style,
@@ -64,7 +137,7 @@ class MplFinanceUtils:
             "ylabel_lower": "Volume",
             "mav": mav,
             "show_nontrading": show_nontrading,
-            "savefig": save_path,
+            "savefig": _savefig_kwargs(save_path),
         }
         # Using dictionary comprehension to filter out None values (MplFinance does not accept None values)
         filtered_params = {k: v for k, v in params.items() if v is not None}
@@ -86,6 +159,16 @@ class ReportChartUtils:
         save_path: Annotated[str, "File path where the plot should be saved"],
     ) -> str:
         """Plot the stock performance of a company compared to the S&P 500 over the past year."""
+        return ReportChartUtils._plot_share_performance(ticker_symbol, filing_date, save_path)
+
+    @staticmethod
+    @chart_cache(FUNDAMENTALS_TTL, "ReportChartUtils.get_share_performance")
+    def _plot_share_performance(
+        ticker_symbol: str,
+        filing_date: str | datetime,
+        save_path: str | IO[bytes],
+    ) -> str:
+        """get_share_performance, also accepting a binary buffer as save_path"""
         if isinstance(filing_date, str):
             filing_date = datetime.strptime(filing_date, "%Y-%m-%d")
 
@@ -147,7 +230,7 @@ class ReportChartUtils:
         # plt.show()
         plot_path = (
             f"{save_path}/stock_performance.png"
-            if os.path.isdir(save_path)
+            if isinstance(save_path, str) and os.path.isdir(save_path)
             else save_path
         )
         plt.savefig(plot_path)
@@ -164,6 +247,17 @@ class ReportChartUtils:
         save_path: Annotated[str, "File path where the plot should be saved"] = None,
     ) -> str:
         """Plot the PE ratio and EPS performance of a company over the past n years."""
+        return ReportChartUtils._plot_pe_eps_performance(ticker_symbol, filing_date, years, save_path)
+
+    @staticmethod
+    @chart_cache(FUNDAMENTALS_TTL, "ReportChartUtils.get_pe_eps_performance")
+    def _plot_pe_eps_performance(
+        ticker_symbol: str,
+        filing_date: str | datetime,
+        years: int = 4,
+        save_path: str | IO[bytes] = None,
+    ) -> str:
+        """get_pe_eps_performance, also accepting a binary buffer as save_path"""
         if isinstance(filing_date, str):
             filing_date = datetime.strptime(filing_date, "%Y-%m-%d")
 
@@ -226,7 +320,9 @@ class ReportChartUtils:
         plt.tight_layout()
         # plt.show()
         plot_path = (
-            f"{save_path}/pe_performance.png" if os.path.isdir(save_path) else save_path
+            f"{save_path}/pe_performance.png"
+            if isinstance(save_path, str) and os.path.isdir(save_path)
+            else save_path
         )
         plt.savefig(plot_path)
         plt.close()
@@ -103,6 +103,20 @@ class StockComparator:
         
         return results
     
+    @staticmethod
+    def _history(
+        ticker: str,
+        batch: Optional[pd.DataFrame],
+        start_date: str,
+        end_date: str
+    ) -> Optional[pd.DataFrame]:
+        """Take one ticker's prices from a batched download, fetching it alone if missing"""
+        if batch is not None and ticker in batch.columns.get_level_values(0):
+            data = batch[ticker].dropna(subset=["Close"])
+            if not data.empty:
+                return data
+        return YFinanceUtils.get_stock_data(ticker, start_date, end_date)
+    
     @staticmethod
     def get_price_performance(tickers: List[str], period_days: int = 365) -> Dict[str, Any]:
         """
@@ -117,12 +131,20 @@ class StockComparator:
         """
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+        
+        # One batched download for every ticker plus the S&P 500 benchmark
+        try:
+            batch = YFinanceUtils.get_multi_stock_data(list(tickers) + ["^GSPC"], start_str, end_str)
+        except Exception:
+            batch = None
         
         results = {
             "tickers": tickers,
             "period_days": period_days,
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d"),
+            "start_date": start_str,
+            "end_date": end_str,
             "performance": {},
             "price_data": {},
             "normalized": {}
@@ -131,11 +153,7 @@ class StockComparator:
         for ticker in tickers:
             try:
                 # Get historical data
-                data = YFinanceUtils.get_stock_data(
-                    ticker,
-                    start_date.strftime("%Y-%m-%d"),
-                    end_date.strftime("%Y-%m-%d")
-                )
+                data = StockComparator._history(ticker, batch, start_str, end_str)
                 
                 if data is not None and not data.empty:
                     # Calculate returns
@@ -171,11 +189,7 @@ class StockComparator:
         
         # Add S&P 500 for comparison
         try:
-            sp500_data = YFinanceUtils.get_stock_data(
-                "^GSPC",
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d")
-            )
+            sp500_data = StockComparator._history("^GSPC", batch, start_str, end_str)
             if sp500_data is not None and not sp500_data.empty:
                 start_price = sp500_data['Close'].iloc[0]
                 end_price = sp500_data['Close'].iloc[-1]
@@ -252,17 +266,19 @@ class StockComparator:
         return results
     
     @staticmethod
-    def create_comparison_table(tickers: List[str]) -> pd.DataFrame:
+    def create_comparison_table(tickers: List[str], data: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Create a formatted comparison table for multiple stocks
         
         Args:
             tickers: List of stock ticker symbols
+            data: Output of get_comparison_data, fetched if not given
             
         Returns:
             DataFrame with comparison data
         """
-        data = StockComparator.get_comparison_data(tickers)
+        if data is None:
+            data = StockComparator.get_comparison_data(tickers)
         
         # Build comparison table
         rows = []
@@ -323,17 +339,19 @@ class StockComparator:
         return df
     
     @staticmethod
-    def identify_best_in_class(tickers: List[str]) -> Dict[str, str]:
+    def identify_best_in_class(tickers: List[str], data: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
         """
         Identify which stock is best for each metric
         
         Args:
             tickers: List of stock ticker symbols
+            data: Output of get_comparison_data, fetched if not given
             
         Returns:
             Dictionary mapping metrics to best performing stock
         """
-        data = StockComparator.get_comparison_data(tickers)
+        if data is None:
+            data = StockComparator.get_comparison_data(tickers)
         
         best = {}
         
@@ -7,6 +7,7 @@ import sqlite3
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
@@ -603,15 +604,18 @@ class AlertManager:
 
 
 # Convenience functions for quick access
+@lru_cache(maxsize=1)
 def get_watchlist_manager() -> WatchlistManager:
-    """Get a WatchlistManager instance"""
+    """Get the shared WatchlistManager instance"""
     return WatchlistManager()
 
+@lru_cache(maxsize=1)
 def get_research_manager() -> ResearchManager:
-    """Get a ResearchManager instance"""
+    """Get the shared ResearchManager instance"""
     return ResearchManager()
 
+@lru_cache(maxsize=1)
 def get_alert_manager() -> AlertManager:
-    """Get an AlertManager instance"""
+    """Get the shared AlertManager instance"""
     return AlertManager()
 
@@ -4,13 +4,27 @@ Defines all available tools for the AI agent to call
 """
 
 import os
+import re
+import sys
 import json
-import tempfile
+import functools
+import contextlib
+import importlib.util
+import io
 import base64
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from datetime import date, timedelta
+from typing import Dict, Any, Optional, List, Type, Tuple, Callable, Union, ClassVar
+
+import orjson
+import requests
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, ValidationError, create_model
 
 # Import all utilities
+from ..utils import DataFetchError
 from ..data_source import YFinanceUtils, FinnHubUtils, FMPUtils
 from .charting import MplFinanceUtils, ReportChartUtils, ComparisonCharts, EarningsCharts, OwnershipCharts, DCFCharts
 from .quantitative import BackTraderUtils
@@ -18,457 +32,766 @@ from .analyzer import ReportAnalysisUtils
 from .strategies import STRATEGY_REGISTRY, STRATEGY_INFO
 from .comparison import StockComparator
 from .earnings import EarningsIntel
-from .storage import WatchlistManager, ResearchManager, AlertManager
+from .storage import get_watchlist_manager, get_research_manager
 from .ownership import OwnershipIntel
 from .dcf import DCFModel
 from .risk import RiskAnalytics
 from .charting import RiskCharts
 
 
+# Default parameters passed to each built-in backtest strategy
+_STRATEGY_DEFAULTS = {
+    "SMA_CrossOver": MappingProxyType({"fast": 10, "slow": 30}),
+    "RSI": MappingProxyType({"period": 14, "oversold": 30, "overbought": 70}),
+    "MACD": MappingProxyType({"fast_period": 12, "slow_period": 26, "signal_period": 9}),
+    "BollingerBands": MappingProxyType({"period": 20, "devfactor": 2.0}),
+}
+
+# Pulls the final portfolio value out of BackTraderUtils.back_test's report
+_FINAL_VALUE_RE = re.compile(r"'Final Portfolio Value': ([\d.]+)")
+
+
+# Failures a data-source call can raise for one bad ticker or upstream hiccup;
+# the tools degrade to a partial result rather than failing the whole call
+_FETCH_ERRORS = (DataFetchError, KeyError, TypeError, ValueError, requests.RequestException)
+
+
+# Line items reported by the financial statement tools
+_KEY_ITEMS_INCOME = ('Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income', 'EBITDA')
+_KEY_ITEMS_BS = ('Total Assets', 'Total Liabilities Net Minority Interest', 'Total Equity Gross Minority Interest', 'Cash And Cash Equivalents')
+_KEY_ITEMS_CF = ('Operating Cash Flow', 'Free Cash Flow', 'Capital Expenditure')
+
+
+def _price_stats(
+    close: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    volume: np.ndarray
+) -> Tuple[float, float, float, float, float]:
+    """Return (current, change %, high, low, average volume) for a price window"""
+    current = close[-1]
+    prev = close[-2] if close.size > 1 else current
+    # A zero previous close has no meaningful change; guarded here because the
+    # jitted kernel raises ZeroDivisionError where numpy would give inf
+    change_pct = (current - prev) / prev * 100 if prev != 0 else 0.0
+    return current, change_pct, np.nanmax(high), np.nanmin(low), np.nanmean(volume)
+
+
+# The stats reduction is compiled when numba is available
+if importlib.util.find_spec("numba") is not None:
+    from numba import njit
+    _price_stats = njit(cache=True)(_price_stats)
+
+
+def _fmt_money(value: float) -> str:
+    """Format a dollar amount as $X.XXB or $X.XXM"""
+    magnitude = -value if value < 0 else value
+    if magnitude >= 1e9:
+        return f"${value / 1e9:.2f}B"
+    return f"${value / 1e6:.2f}M"
+
+
+def _extract_metrics(data: pd.DataFrame, key_items: Tuple[str, ...]) -> Dict[str, str]:
+    """Format the given line items from the most recent period of a statement"""
+    latest = data.iloc[:, 0].reindex(key_items).dropna()
+    return {item: _fmt_money(value) for item, value in latest.items() if value}
+
+
+def _date_window(days: int) -> Tuple[str, str]:
+    """Return (start, end) ISO dates for the `days` leading up to today"""
+    end = date.today()
+    return (end - timedelta(days=days)).isoformat(), end.isoformat()
+
+
+def _chart_to_b64(buf: io.BytesIO) -> str:
+    """Base64-encode a chart rendered into an in-memory buffer"""
+    data = buf.getvalue()
+    if not data:
+        raise ValueError("Chart could not be rendered")
+    return base64.b64encode(data).decode()
+
+
+def _attach_chart(result: Dict[str, Any], buf: io.BytesIO) -> None:
+    """
+    Add a rendered chart to a tool result. Chart helpers skip saving when there
+    is nothing to plot; the result's data is still returned, without an image.
+    """
+    data = buf.getvalue()
+    if data:
+        result["image_base64"] = base64.b64encode(data).decode()
+        result["has_image"] = True
+
+
 # ============================================================================
 # TOOL DEFINITIONS (OpenAI Function Schemas)
 # ============================================================================
 
-TOOL_DEFINITIONS = [
-    {
-        "type": "function",
-        "function": {
-            "name": "get_stock_price",
-            "description": "Get historical stock price data for a ticker symbol. Returns OHLCV data.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., AAPL, NVDA, MSFT)"
+# Property schemas shared by most tools. Each is a single object referenced
+# from every tool that uses it; it is inlined again when serialized.
+_TICKER_PROP = {"type": "string", "description": "Stock ticker symbol"}
+_TICKER_EXAMPLE_PROP = {"type": "string", "description": "Stock ticker symbol (e.g., NVDA, AAPL)"}
+
+
+@functools.cache
+def _build_tool_definitions() -> List[Dict[str, Any]]:
+    """Build the tool schema on first use"""
+    return [
+        {
+            "type": "function",
+            "function": {
+                "name": "get_stock_price",
+                "description": "Get historical stock price data for a ticker symbol. Returns OHLCV data.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": {
+                            "type": "string",
+                            "description": "Stock ticker symbol (e.g., AAPL, NVDA, MSFT)"
+                        },
+                        "days": {
+                            "type": "integer",
+                            "description": "Number of days of historical data (default 30)",
+                            "default": 30
+                        }
                     },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days of historical data (default 30)",
-                        "default": 30
-                    }
-                },
-                "required": ["ticker"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_income_statement",
-            "description": "Get the income statement (revenue, expenses, profit) for a company.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    }
-                },
-                "required": ["ticker"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_balance_sheet",
-            "description": "Get the balance sheet (assets, liabilities, equity) for a company.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    }
-                },
-                "required": ["ticker"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_cash_flow",
-            "description": "Get the cash flow statement for a company.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    }
-                },
-                "required": ["ticker"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_company_profile",
-            "description": "Get company profile information including industry, market cap, description.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_company_news",
-            "description": "Get recent news articles about a company.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_income_statement",
+                "description": "Get the income statement (revenue, expenses, profit) for a company.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP
                     },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days to look back for news (default 7)",
-                        "default": 7
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "create_price_chart",
-            "description": "Create a stock price chart. Returns the chart as an image.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["candle", "line", "ohlc", "renko", "pnf"],
-                        "description": "Type of chart to create",
-                        "default": "candle"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_balance_sheet",
+                "description": "Get the balance sheet (assets, liabilities, equity) for a company.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP
                     },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days of data to show (default 90)",
-                        "default": 90
-                    }
-                },
-                "required": ["ticker"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "create_comparison_chart",
-            "description": "Create a chart comparing stock performance vs S&P 500 over the past year.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol to compare"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "run_backtest",
-            "description": "Run a trading strategy backtest on historical data. Available strategies: SMA_CrossOver, RSI, MACD, BollingerBands, MA_Ribbon",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    },
-                    "strategy": {
-                        "type": "string",
-                        "enum": ["SMA_CrossOver", "RSI", "MACD", "BollingerBands", "MA_Ribbon"],
-                        "description": "Trading strategy to test"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_cash_flow",
+                "description": "Get the cash flow statement for a company.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP
                     },
-                    "initial_capital": {
-                        "type": "number",
-                        "description": "Starting capital in USD (default 10000)",
-                        "default": 10000
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days of historical data (default 365)",
-                        "default": 365
-                    }
-                },
-                "required": ["ticker", "strategy"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "analyze_financials",
-            "description": "Get AI-powered analysis of a company's financial statements.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_company_profile",
+                "description": "Get company profile information including industry, market cap, description.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP
                     },
-                    "analysis_type": {
-                        "type": "string",
-                        "enum": ["income", "balance", "cashflow", "risk", "segment"],
-                        "description": "Type of analysis to perform"
-                    },
-                    "fiscal_year": {
-                        "type": "string",
-                        "description": "Fiscal year (default current year)",
-                        "default": "2024"
-                    }
-                },
-                "required": ["ticker", "analysis_type"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_basic_financials",
-            "description": "Get key financial metrics like P/E ratio, market cap, 52-week high/low.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "compare_stocks",
-            "description": "Compare multiple stocks side-by-side on financials, valuations, growth, and performance. Great for analyzing competitors or sector peers.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "tickers": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of stock ticker symbols to compare (e.g., ['NVDA', 'AMD', 'INTC'])"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_company_news",
+                "description": "Get recent news articles about a company.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP,
+                        "days": {
+                            "type": "integer",
+                            "description": "Number of days to look back for news (default 7)",
+                            "default": 7
+                        }
                     },
-                    "include_chart": {
-                        "type": "boolean",
-                        "description": "Whether to generate a performance comparison chart (default true)",
-                        "default": True
-                    },
-                    "period_days": {
-                        "type": "integer",
-                        "description": "Number of days for performance comparison (default 365)",
-                        "default": 365
-                    }
-                },
-                "required": ["tickers"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_earnings_intel",
-            "description": "Get comprehensive earnings intelligence including EPS history, revenue trends, analyst estimates, next earnings date, and beat/miss streaks. Great for understanding a company's earnings performance.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., NVDA, AAPL)"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "create_price_chart",
+                "description": "Create a stock price chart. Returns the chart as an image.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP,
+                        "chart_type": {
+                            "type": "string",
+                            "enum": ["candle", "line", "ohlc", "renko", "pnf"],
+                            "description": "Type of chart to create",
+                            "default": "candle"
+                        },
+                        "days": {
+                            "type": "integer",
+                            "description": "Number of days of data to show (default 90)",
+                            "default": 90
+                        }
                     },
-                    "include_chart": {
-                        "type": "boolean",
-                        "description": "Whether to generate an EPS surprise chart (default true)",
-                        "default": True
-                    },
-                    "quarters": {
-                        "type": "integer",
-                        "description": "Number of quarters of history (default 8)",
-                        "default": 8
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "manage_watchlist",
-            "description": "Add or remove stocks from watchlist, view watchlist items, or save research notes. Use this to track stocks you're interested in.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "action": {
-                        "type": "string",
-                        "enum": ["add", "remove", "list", "save_note", "get_notes"],
-                        "description": "Action to perform: 'add' a stock, 'remove' a stock, 'list' watchlist items, 'save_note' for research, 'get_notes' for a ticker"
-                    },
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (required for add, remove, save_note, get_notes)"
-                    },
-                    "notes": {
-                        "type": "string",
-                        "description": "Notes to save (for add or save_note action)"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "create_comparison_chart",
+                "description": "Create a chart comparing stock performance vs S&P 500 over the past year.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": {
+                            "type": "string",
+                            "description": "Stock ticker symbol to compare"
+                        }
                     },
-                    "target_price": {
-                        "type": "number",
-                        "description": "Target price for the stock (optional for add action)"
-                    },
-                    "note_title": {
-                        "type": "string",
-                        "description": "Title for research note (for save_note action)"
-                    }
-                },
-                "required": ["action"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_ownership_intel",
-            "description": "Get comprehensive ownership analysis including institutional holders, insider trading activity, mutual fund holdings, and ownership breakdown. Great for understanding who owns a stock and insider sentiment.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., NVDA, AAPL)"
-                    },
-                    "include_chart": {
-                        "type": "boolean",
-                        "description": "Whether to generate an ownership breakdown chart (default true)",
-                        "default": True
-                    },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["pie", "holders", "insider", "comparison"],
-                        "description": "Type of chart: 'pie' for ownership breakdown, 'holders' for top institutional holders, 'insider' for insider activity, 'comparison' for multiple stocks",
-                        "default": "pie"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "run_backtest",
+                "description": "Run a trading strategy backtest on historical data. Available strategies: SMA_CrossOver, RSI, MACD, BollingerBands, MA_Ribbon",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP,
+                        "strategy": {
+                            "type": "string",
+                            "enum": ["SMA_CrossOver", "RSI", "MACD", "BollingerBands", "MA_Ribbon"],
+                            "description": "Trading strategy to test"
+                        },
+                        "initial_capital": {
+                            "type": "number",
+                            "description": "Starting capital in USD (default 10000)",
+                            "default": 10000
+                        },
+                        "days": {
+                            "type": "integer",
+                            "description": "Number of days of historical data (default 365)",
+                            "default": 365
+                        }
                     },
-                    "compare_with": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Other tickers to compare ownership with (for 'comparison' chart type)"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker", "strategy"]
+                }
             }
-        }
-    },
-    # DCF Valuation Tool
-    {
-        "type": "function",
-        "function": {
-            "name": "run_dcf_analysis",
-            "description": "Run a comprehensive Discounted Cash Flow (DCF) valuation model for a stock. Calculates intrinsic value per share based on projected free cash flows, WACC, and terminal value. Can also generate projection charts, sensitivity analysis heatmaps, and valuation waterfall charts.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., NVDA, AAPL)"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "analyze_financials",
+                "description": "Get AI-powered analysis of a company's financial statements.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP,
+                        "analysis_type": {
+                            "type": "string",
+                            "enum": ["income", "balance", "cashflow", "risk", "segment"],
+                            "description": "Type of analysis to perform"
+                        },
+                        "fiscal_year": {
+                            "type": "string",
+                            "description": "Fiscal year (default current year)",
+                            "default": "2024"
+                        }
                     },
-                    "include_chart": {
-                        "type": "boolean",
-                        "description": "Whether to generate a chart (default true)",
-                        "default": True
-                    },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["projection", "sensitivity", "waterfall"],
-                        "description": "Type of chart: 'projection' for revenue/FCF projections, 'sensitivity' for WACC vs Growth matrix, 'waterfall' for valuation breakdown",
-                        "default": "waterfall"
+                    "required": ["ticker", "analysis_type"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_basic_financials",
+                "description": "Get key financial metrics like P/E ratio, market cap, 52-week high/low.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_PROP
                     },
-                    "revenue_growth_override": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                        "description": "Optional custom revenue growth rates for 5 years (e.g., [0.25, 0.20, 0.15, 0.10, 0.08])"
+                    "required": ["ticker"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "compare_stocks",
+                "description": "Compare multiple stocks side-by-side on financials, valuations, growth, and performance. Great for analyzing competitors or sector peers.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "tickers": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "List of stock ticker symbols to compare (e.g., ['NVDA', 'AMD', 'INTC'])"
+                        },
+                        "include_chart": {
+                            "type": "boolean",
+                            "description": "Whether to generate a performance comparison chart (default true)",
+                            "default": True
+                        },
+                        "period_days": {
+                            "type": "integer",
+                            "description": "Number of days for performance comparison (default 365)",
+                            "default": 365
+                        }
                     },
-                    "terminal_growth": {
-                        "type": "number",
-                        "description": "Terminal growth rate (default 2.5%)",
-                        "default": 0.025
+                    "required": ["tickers"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_earnings_intel",
+                "description": "Get comprehensive earnings intelligence including EPS history, revenue trends, analyst estimates, next earnings date, and beat/miss streaks. Great for understanding a company's earnings performance.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_EXAMPLE_PROP,
+                        "include_chart": {
+                            "type": "boolean",
+                            "description": "Whether to generate an EPS surprise chart (default true)",
+                            "default": True
+                        },
+                        "quarters": {
+                            "type": "integer",
+                            "description": "Number of quarters of history (default 8)",
+                            "default": 8
+                        }
                     },
-                    "wacc_override": {
-                        "type": "number",
-                        "description": "Optional WACC override (as decimal, e.g., 0.10 for 10%)"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
-        }
-    },
-    # Risk Analysis Tool
-    {
-        "type": "function",
-        "function": {
-            "name": "get_risk_analysis",
-            "description": "Get comprehensive risk analysis including Value at Risk (VaR), Sharpe Ratio, Maximum Drawdown, Volatility, Beta, and Alpha. Can also generate risk charts like VaR distribution, drawdown analysis, volatility trends, and correlation heatmaps.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "ticker": {
-                        "type": "string",
-                        "description": "Stock ticker symbol (e.g., NVDA, AAPL)"
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "manage_watchlist",
+                "description": "Add or remove stocks from watchlist, view watchlist items, or save research notes. Use this to track stocks you're interested in.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "action": {
+                            "type": "string",
+                            "enum": ["add", "remove", "list", "save_note", "get_notes"],
+                            "description": "Action to perform: 'add' a stock, 'remove' a stock, 'list' watchlist items, 'save_note' for research, 'get_notes' for a ticker"
+                        },
+                        "ticker": {
+                            "type": "string",
+                            "description": "Stock ticker symbol (required for add, remove, save_note, get_notes)"
+                        },
+                        "notes": {
+                            "type": "string",
+                            "description": "Notes to save (for add or save_note action)"
+                        },
+                        "target_price": {
+                            "type": "number",
+                            "description": "Target price for the stock (optional for add action)"
+                        },
+                        "note_title": {
+                            "type": "string",
+                            "description": "Title for research note (for save_note action)"
+                        }
                     },
-                    "period": {
-                        "type": "string",
-                        "enum": ["1m", "3m", "6m", "1y", "2y"],
-                        "description": "Time period for analysis (default 1y)",
-                        "default": "1y"
+                    "required": ["action"]
+                }
+            }
+        },
+        {
+            "type": "function",
+            "function": {
+                "name": "get_ownership_intel",
+                "description": "Get comprehensive ownership analysis including institutional holders, insider trading activity, mutual fund holdings, and ownership breakdown. Great for understanding who owns a stock and insider sentiment.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_EXAMPLE_PROP,
+                        "include_chart": {
+                            "type": "boolean",
+                            "description": "Whether to generate an ownership breakdown chart (default true)",
+                            "default": True
+                        },
+                        "chart_type": {
+                            "type": "string",
+                            "enum": ["pie", "holders", "insider", "comparison"],
+                            "description": "Type of chart: 'pie' for ownership breakdown, 'holders' for top institutional holders, 'insider' for insider activity, 'comparison' for multiple stocks",
+                            "default": "pie"
+                        },
+                        "compare_with": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Other tickers to compare ownership with (for 'comparison' chart type)"
+                        }
                     },
-                    "include_chart": {
-                        "type": "boolean",
-                        "description": "Whether to generate a chart (default true)",
-                        "default": True
+                    "required": ["ticker"]
+                }
+            }
+        },
+        # DCF Valuation Tool
+        {
+            "type": "function",
+            "function": {
+                "name": "run_dcf_analysis",
+                "description": "Run a comprehensive Discounted Cash Flow (DCF) valuation model for a stock. Calculates intrinsic value per share based on projected free cash flows, WACC, and terminal value. Can also generate projection charts, sensitivity analysis heatmaps, and valuation waterfall charts.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_EXAMPLE_PROP,
+                        "include_chart": {
+                            "type": "boolean",
+                            "description": "Whether to generate a chart (default true)",
+                            "default": True
+                        },
+                        "chart_type": {
+                            "type": "string",
+                            "enum": ["projection", "sensitivity", "waterfall"],
+                            "description": "Type of chart: 'projection' for revenue/FCF projections, 'sensitivity' for WACC vs Growth matrix, 'waterfall' for valuation breakdown",
+                            "default": "waterfall"
+                        },
+                        "revenue_growth_override": {
+                            "type": "array",
+                            "items": {"type": "number"},
+                            "description": "Optional custom revenue growth rates for 5 years (e.g., [0.25, 0.20, 0.15, 0.10, 0.08])"
+                        },
+                        "terminal_growth": {
+                            "type": "number",
+                            "description": "Terminal growth rate (default 2.5%)",
+                            "default": 0.025
+                        },
+                        "wacc_override": {
+                            "type": "number",
+                            "description": "Optional WACC override (as decimal, e.g., 0.10 for 10%)"
+                        }
                     },
-                    "chart_type": {
-                        "type": "string",
-                        "enum": ["var", "drawdown", "volatility", "correlation"],
-                        "description": "Type of chart: 'var' for VaR distribution, 'drawdown' for drawdown analysis, 'volatility' for rolling volatility, 'correlation' for correlation heatmap (requires compare_with)",
-                        "default": "drawdown"
+                    "required": ["ticker"]
+                }
+            }
+        },
+        # Risk Analysis Tool
+        {
+            "type": "function",
+            "function": {
+                "name": "get_risk_analysis",
+                "description": "Get comprehensive risk analysis including Value at Risk (VaR), Sharpe Ratio, Maximum Drawdown, Volatility, Beta, and Alpha. Can also generate risk charts like VaR distribution, drawdown analysis, volatility trends, and correlation heatmaps.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "ticker": _TICKER_EXAMPLE_PROP,
+                        "period": {
+                            "type": "string",
+                            "enum": ["1m", "3m", "6m", "1y", "2y"],
+                            "description": "Time period for analysis (default 1y)",
+                            "default": "1y"
+                        },
+                        "include_chart": {
+                            "type": "boolean",
+                            "description": "Whether to generate a chart (default true)",
+                            "default": True
+                        },
+                        "chart_type": {
+                            "type": "string",
+                            "enum": ["var", "drawdown", "volatility", "correlation"],
+                            "description": "Type of chart: 'var' for VaR distribution, 'drawdown' for drawdown analysis, 'volatility' for rolling volatility, 'correlation' for correlation heatmap (requires compare_with)",
+                            "default": "drawdown"
+                        },
+                        "compare_with": {
+                            "type": "array",
+                            "items": {"type": "string"},
+                            "description": "Other tickers to compare correlation with (for 'correlation' chart type)"
+                        }
                     },
-                    "compare_with": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Other tickers to compare correlation with (for 'correlation' chart type)"
-                    }
-                },
-                "required": ["ticker"]
+                    "required": ["ticker"]
+                }
             }
         }
+    ]
+
+
+def _freeze(obj: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples,
+    interning every string so repeated keys and values share one object.
+    Sub-schemas that are shared by identity stay shared after freezing.
+    """
+    if memo is None:
+        memo = {}
+    if id(obj) in memo:
+        return memo[id(obj)]
+    if isinstance(obj, dict):
+        frozen = MappingProxyType({sys.intern(k): _freeze(v, memo) for k, v in obj.items()})
+    elif isinstance(obj, list):
+        frozen = tuple(_freeze(v, memo) for v in obj)
+    elif isinstance(obj, str):
+        frozen = sys.intern(obj)
+    else:
+        frozen = obj
+    memo[id(obj)] = frozen
+    return frozen
+
+
+# The schema never changes at runtime, so serialize it once for callers that
+# send it over the wire, and keep a deeply read-only copy for in-process
+# readers. TOOL_DEFINITIONS itself stays plain lists/dicts because the OpenAI
+# client serializes it with the stdlib json encoder.
+@functools.cache
+def get_tool_definitions_json() -> bytes:
+    """Return the pre-serialized tool schema"""
+    return orjson.dumps(_build_tool_definitions())
+
+
+def _to_openai(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return tools
+
+
+def _to_anthropic(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": tool["function"]["name"],
+            "description": tool["function"]["description"],
+            "input_schema": tool["function"]["parameters"],
+        }
+        for tool in tools
+    ]
+
+
+def _to_gemini(tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{"function_declarations": [tool["function"] for tool in tools]}]
+
+
+_PROVIDER_ENCODERS = {
+    "openai": _to_openai,
+    "anthropic": _to_anthropic,
+    "gemini": _to_gemini,
+}
+
+
+@functools.cache
+def get_tools_for(provider: str) -> bytes:
+    """Return the tool schema serialized in the given provider's wire format"""
+    encoder = _PROVIDER_ENCODERS.get(provider)
+    if encoder is None:
+        raise ValueError(f"Unknown provider: {provider}. Use one of {list(_PROVIDER_ENCODERS)}")
+    return orjson.dumps(encoder(_build_tool_definitions()))
+
+
+@functools.cache
+def _build_frozen_tool_definitions() -> tuple:
+    return _freeze(_build_tool_definitions())
+
+
+@functools.cache
+def _build_lean_tool_definitions() -> tuple:
+    """
+    Schema copy without descriptions, used on the validation/dispatch path.
+    Descriptions are only needed when the schema is sent to the LLM.
+    """
+    lean = []
+    for tool in _build_frozen_tool_definitions():
+        function = tool["function"]
+        parameters = function["parameters"]
+        properties = {
+            prop_name: MappingProxyType({k: v for k, v in prop.items() if k != "description"})
+            for prop_name, prop in parameters["properties"].items()
+        }
+        lean.append(MappingProxyType({
+            "name": function["name"],
+            "required": parameters.get("required", ()),
+            "properties": MappingProxyType(properties),
+        }))
+    return tuple(lean)
+
+
+@functools.cache
+def _build_tool_enums() -> Dict[str, Dict[str, frozenset]]:
+    """Allowed values per enum argument, keyed by tool name then argument"""
+    enums = {}
+    for tool in _build_lean_tool_definitions():
+        enums[tool["name"]] = {
+            prop_name: frozenset(prop["enum"])
+            for prop_name, prop in tool["properties"].items()
+            if "enum" in prop
+        }
+    return enums
+
+
+@functools.cache
+def _build_tool_defaults() -> Dict[str, Dict[str, Any]]:
+    """Schema default values per tool, keyed by tool name then argument"""
+    return {
+        tool["name"]: {
+            prop_name: prop["default"]
+            for prop_name, prop in tool["properties"].items()
+            if "default" in prop
+        }
+        for tool in _build_lean_tool_definitions()
     }
-]
+
+
+@functools.cache
+def _build_tool_names() -> Tuple[str, ...]:
+    return tuple(tool["name"] for tool in _build_lean_tool_definitions())
+
+
+# Schema attributes are built on first access (PEP 562) so importing this
+# module does not pay for constructing them
+_LAZY_ATTRIBUTES = {
+    "TOOL_DEFINITIONS": _build_tool_definitions,
+    "TOOL_DEFINITIONS_JSON": get_tool_definitions_json,
+    "TOOL_DEFINITIONS_FROZEN": _build_frozen_tool_definitions,
+    "TOOL_DEFINITIONS_LEAN": _build_lean_tool_definitions,
+    "TOOL_ENUMS": _build_tool_enums,
+    "TOOL_DEFAULTS": _build_tool_defaults,
+    "TOOL_NAMES": _build_tool_names,
+}
+
+
+def __getattr__(name: str) -> Any:
+    builder = _LAZY_ATTRIBUTES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return builder()
+
+
+# ============================================================================
+# ARGUMENT MODELS (derived from the tool schema)
+# ============================================================================
+
+_JSON_TYPES = {"string": str, "integer": int, "number": float, "boolean": bool}
+
+
+def _annotation_for(prop: Dict[str, Any]) -> Any:
+    """
+    Map a JSON-schema property to a Python type annotation. Enum membership
+    is checked separately against TOOL_ENUMS, so only the base type is used.
+    """
+    if prop["type"] == "array":
+        return List[_annotation_for(prop["items"])]
+    return _JSON_TYPES[prop["type"]]
+
+
+def _model_name(tool_name: str) -> str:
+    return "".join(part.title() for part in tool_name.split("_")) + "Args"
+
+
+@functools.cache
+def get_argument_model(tool_name: str) -> Optional[Type[BaseModel]]:
+    """
+    Return the pydantic model that validates arguments for a tool, built once
+    from the tool's JSON schema. Returns None for unknown tools.
+    """
+    for tool in _build_lean_tool_definitions():
+        if tool["name"] != tool_name:
+            continue
+        required = set(tool["required"])
+        defaults = _build_tool_defaults()[tool_name]
+        fields = {}
+        for prop_name, prop in tool["properties"].items():
+            annotation = _annotation_for(prop)
+            if prop_name in required:
+                fields[prop_name] = (annotation, ...)
+            elif prop_name in defaults:
+                fields[prop_name] = (annotation, defaults[prop_name])
+            else:
+                fields[prop_name] = (Optional[annotation], None)
+        return create_model(
+            _model_name(tool_name),
+            __config__=ConfigDict(extra="forbid"),
+            __module__=__name__,
+            **fields
+        )
+    return None
+
+
+# ============================================================================
+# ARGUMENT PRE-CHECKS
+# ============================================================================
+
+def _is_ticker(value: Any) -> bool:
+    """Cheap sanity check for a ticker symbol before any network call"""
+    return isinstance(value, str) and value.isascii() and 1 <= len(value) <= 10
+
+
+_TICKER_RULE = "must be a ticker symbol of 1-10 ASCII characters"
+
+
+def _check_ticker(arguments: Dict[str, Any]) -> Optional[str]:
+    """Describe what is wrong with the ticker argument, or None if it is usable"""
+    ticker = arguments.get("ticker")
+    if ticker is None:
+        return "ticker is required"
+    if not _is_ticker(ticker):
+        return f"ticker {_TICKER_RULE}"
+    return None
+
+
+def _check_tickers(arguments: Dict[str, Any]) -> Optional[str]:
+    tickers = arguments.get("tickers")
+    if not isinstance(tickers, list) or not tickers:
+        return "tickers must be a non-empty list"
+    for i, ticker in enumerate(tickers):
+        if not _is_ticker(ticker):
+            return f"tickers[{i}] {_TICKER_RULE}"
+    return None
+
+
+def _check_optional_ticker(arguments: Dict[str, Any]) -> Optional[str]:
+    if arguments.get("ticker") is None:
+        return None
+    return _check_ticker(arguments)
+
+
+# Per-tool validators, run before dispatch so obviously bad input is rejected
+# locally instead of after a failed round-trip to the data provider
+_VALIDATORS = {
+    "get_stock_price": _check_ticker,
+    "get_income_statement": _check_ticker,
+    "get_balance_sheet": _check_ticker,
+    "get_cash_flow": _check_ticker,
+    "get_company_profile": _check_ticker,
+    "get_company_news": _check_ticker,
+    "create_price_chart": _check_ticker,
+    "create_comparison_chart": _check_ticker,
+    "run_backtest": _check_ticker,
+    "analyze_financials": _check_ticker,
+    "get_basic_financials": _check_ticker,
+    "compare_stocks": _check_tickers,
+    "get_earnings_intel": _check_ticker,
+    "manage_watchlist": _check_optional_ticker,
+    "get_ownership_intel": _check_ticker,
+    "run_dcf_analysis": _check_ticker,
+    "get_risk_analysis": _check_ticker,
+}
 
 
 # ============================================================================
@@ -482,68 +805,89 @@ class ToolExecutor:
     def execute(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute a tool and return the result"""
         
+        model = get_argument_model(tool_name)
+        if model is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        
+        if not isinstance(arguments, dict):
+            return {"error": f"Arguments for {tool_name} must be an object"}
+        
+        # Schema defaults are merged first so they get the same coercion as
+        # values supplied by the LLM
+        arguments = {**_build_tool_defaults()[tool_name], **arguments}
         try:
-            if tool_name == "get_stock_price":
-                return ToolExecutor._get_stock_price(**arguments)
-            elif tool_name == "get_income_statement":
-                return ToolExecutor._get_income_statement(**arguments)
-            elif tool_name == "get_balance_sheet":
-                return ToolExecutor._get_balance_sheet(**arguments)
-            elif tool_name == "get_cash_flow":
-                return ToolExecutor._get_cash_flow(**arguments)
-            elif tool_name == "get_company_profile":
-                return ToolExecutor._get_company_profile(**arguments)
-            elif tool_name == "get_company_news":
-                return ToolExecutor._get_company_news(**arguments)
-            elif tool_name == "create_price_chart":
-                return ToolExecutor._create_price_chart(**arguments)
-            elif tool_name == "create_comparison_chart":
-                return ToolExecutor._create_comparison_chart(**arguments)
-            elif tool_name == "run_backtest":
-                return ToolExecutor._run_backtest(**arguments)
-            elif tool_name == "analyze_financials":
-                return ToolExecutor._analyze_financials(**arguments)
-            elif tool_name == "get_basic_financials":
-                return ToolExecutor._get_basic_financials(**arguments)
-            elif tool_name == "compare_stocks":
-                return ToolExecutor._compare_stocks(**arguments)
-            elif tool_name == "get_earnings_intel":
-                return ToolExecutor._get_earnings_intel(**arguments)
-            elif tool_name == "manage_watchlist":
-                return ToolExecutor._manage_watchlist(**arguments)
-            elif tool_name == "get_ownership_intel":
-                return ToolExecutor._get_ownership_intel(**arguments)
-            elif tool_name == "run_dcf_analysis":
-                return ToolExecutor._run_dcf_analysis(**arguments)
-            elif tool_name == "get_risk_analysis":
-                return ToolExecutor._get_risk_analysis(**arguments)
-            else:
-                return {"error": f"Unknown tool: {tool_name}"}
+            arguments = model.model_validate(arguments).model_dump()
+        except ValidationError as e:
+            return {"error": f"Invalid arguments for {tool_name}: {e}"}
+        
+        return ToolExecutor._run_tool(tool_name, arguments)
+    
+    @staticmethod
+    def execute_json(tool_name: str, raw_arguments: Union[str, bytes]) -> Dict[str, Any]:
+        """
+        Execute a tool from the raw JSON arguments of an LLM tool call.
+        Parsing, type coercion and defaults happen in one pydantic-core pass.
+        """
+        
+        model = get_argument_model(tool_name)
+        if model is None:
+            return {"error": f"Unknown tool: {tool_name}"}
+        
+        try:
+            arguments = model.model_validate_json(raw_arguments).model_dump()
+        except ValidationError as e:
+            return {"error": f"Invalid arguments for {tool_name}: {e}"}
+        
+        return ToolExecutor._run_tool(tool_name, arguments)
+    
+    @staticmethod
+    def _run_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the remaining argument checks and call the tool's handler"""
+        
+        # Normalize tickers once here so handlers can use them as-is
+        ticker = arguments.get("ticker")
+        if isinstance(ticker, str):
+            arguments["ticker"] = sys.intern(ticker.strip().upper())
+        tickers = arguments.get("tickers")
+        if isinstance(tickers, list):
+            arguments["tickers"] = [t.strip() if isinstance(t, str) else t for t in tickers]
+        
+        for arg_name, allowed in _build_tool_enums()[tool_name].items():
+            value = arguments.get(arg_name)
+            if value is not None and value not in allowed:
+                return {"error": f"Invalid {arg_name} '{value}' for {tool_name}. Expected one of: {', '.join(sorted(allowed))}"}
+        
+        validator = _VALIDATORS.get(tool_name)
+        problem = validator(arguments) if validator else None
+        if problem:
+            return {"error": f"Invalid arguments for {tool_name}: {problem}"}
+        
+        try:
+            return ToolExecutor._DISPATCH[tool_name](**arguments)
         except Exception as e:
             return {"error": str(e)}
     
     @staticmethod
     def _get_stock_price(ticker: str, days: int = 30) -> Dict[str, Any]:
         """Get stock price data"""
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = _date_window(days)
         
         data = YFinanceUtils.get_stock_data(
             ticker,
-            start_date.strftime("%Y-%m-%d"),
-            end_date.strftime("%Y-%m-%d")
+            start_date,
+            end_date
         )
         
         if data is None or data.empty:
             return {"error": f"No data found for {ticker}"}
         
-        # Get summary stats
-        current_price = data['Close'].iloc[-1]
-        prev_close = data['Close'].iloc[-2] if len(data) > 1 else current_price
-        change_pct = ((current_price - prev_close) / prev_close) * 100
-        high = data['High'].max()
-        low = data['Low'].min()
-        avg_volume = data['Volume'].mean()
+        # Get summary stats; only the last two closes feed the current price and change
+        current_price, change_pct, high, low, avg_volume = _price_stats(
+            data['Close'].iloc[-2:].to_numpy(dtype=np.float64),
+            data['High'].to_numpy(dtype=np.float64),
+            data['Low'].to_numpy(dtype=np.float64),
+            data['Volume'].to_numpy(dtype=np.float64)
+        )
         
         return {
             "ticker": ticker,
@@ -566,18 +910,7 @@ class ToolExecutor:
             return {"error": f"No income statement data for {ticker}"}
         
         # Extract key metrics from most recent period
-        latest = data.iloc[:, 0]
-        
-        result = {"ticker": ticker, "metrics": {}}
-        key_items = ['Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income', 'EBITDA']
-        
-        for item in key_items:
-            if item in latest.index:
-                value = latest[item]
-                if value and not pd.isna(value):
-                    result["metrics"][item] = f"${value/1e9:.2f}B" if abs(value) >= 1e9 else f"${value/1e6:.2f}M"
-        
-        return result
+        return {"ticker": ticker, "metrics": _extract_metrics(data, _KEY_ITEMS_INCOME)}
     
     @staticmethod
     def _get_balance_sheet(ticker: str) -> Dict[str, Any]:
@@ -587,17 +920,7 @@ class ToolExecutor:
         if data is None or data.empty:
             return {"error": f"No balance sheet data for {ticker}"}
         
-        latest = data.iloc[:, 0]
-        result = {"ticker": ticker, "metrics": {}}
-        key_items = ['Total Assets', 'Total Liabilities Net Minority Interest', 'Total Equity Gross Minority Interest', 'Cash And Cash Equivalents']
-        
-        for item in key_items:
-            if item in latest.index:
-                value = latest[item]
-                if value and not pd.isna(value):
-                    result["metrics"][item] = f"${value/1e9:.2f}B" if abs(value) >= 1e9 else f"${value/1e6:.2f}M"
-        
-        return result
+        return {"ticker": ticker, "metrics": _extract_metrics(data, _KEY_ITEMS_BS)}
     
     @staticmethod
     def _get_cash_flow(ticker: str) -> Dict[str, Any]:
@@ -607,27 +930,15 @@ class ToolExecutor:
         if data is None or data.empty:
             return {"error": f"No cash flow data for {ticker}"}
         
-        latest = data.iloc[:, 0]
-        result = {"ticker": ticker, "metrics": {}}
-        key_items = ['Operating Cash Flow', 'Free Cash Flow', 'Capital Expenditure']
-        
-        for item in key_items:
-            if item in latest.index:
-                value = latest[item]
-                if value and not pd.isna(value):
-                    result["metrics"][item] = f"${value/1e9:.2f}B" if abs(value) >= 1e9 else f"${value/1e6:.2f}M"
-        
-        return result
+        return {"ticker": ticker, "metrics": _extract_metrics(data, _KEY_ITEMS_CF)}
     
     @staticmethod
     def _get_company_profile(ticker: str) -> Dict[str, Any]:
         """Get company profile"""
-        try:
+        with contextlib.suppress(*_FETCH_ERRORS):
             profile = FinnHubUtils.get_company_profile(ticker)
             if profile:
                 return {"ticker": ticker, "profile": profile}
-        except:
-            pass
         
         # Fallback to yfinance
         try:
@@ -649,23 +960,23 @@ class ToolExecutor:
     def _get_company_news(ticker: str, days: int = 7) -> Dict[str, Any]:
         """Get company news"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            start_date, end_date = _date_window(days)
             
             news_df = FinnHubUtils.get_company_news(
                 ticker,
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
+                start_date,
+                end_date,
                 max_news_num=5
             )
             
             if news_df is not None and not news_df.empty:
-                news_items = []
-                for _, row in news_df.iterrows():
-                    news_items.append({
-                        "headline": row.get('headline', 'No headline'),
-                        "summary": row.get('summary', '')[:200]
-                    })
+                rows = news_df[['headline', 'summary']].fillna(
+                    {'headline': 'No headline', 'summary': ''}
+                ).to_dict('records')
+                news_items = [
+                    {"headline": row['headline'], "summary": row['summary'][:200]}
+                    for row in rows
+                ]
                 return {"ticker": ticker, "news": news_items}
             
             return {"ticker": ticker, "news": [], "message": "No recent news found"}
@@ -676,28 +987,21 @@ class ToolExecutor:
     def _create_price_chart(ticker: str, chart_type: str = "candle", days: int = 90) -> Dict[str, Any]:
         """Create a price chart and return as base64 image"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            start_date, end_date = _date_window(days)
             
-            # Create temp file for chart
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
+            # Render the chart in memory
+            buf = io.BytesIO()
             
-            MplFinanceUtils.plot_stock_price_chart(
-                ticker_symbol=ticker,
-                start_date=start_date.strftime("%Y-%m-%d"),
-                end_date=end_date.strftime("%Y-%m-%d"),
-                save_path=tmp_path,
+            stock_data = YFinanceUtils.get_stock_data(ticker, start_date, end_date)
+            MplFinanceUtils._plot_price_data(
+                stock_data,
+                ticker,
+                buf,
                 type=chart_type,
                 style="nightclouds"
             )
             
-            # Read and encode image
-            with open(tmp_path, 'rb') as f:
-                img_data = base64.b64encode(f.read()).decode()
-            
-            # Cleanup
-            os.unlink(tmp_path)
+            img_data = _chart_to_b64(buf)
             
             return {
                 "ticker": ticker,
@@ -712,19 +1016,15 @@ class ToolExecutor:
     def _create_comparison_chart(ticker: str) -> Dict[str, Any]:
         """Create stock vs S&P 500 comparison chart"""
         try:
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
+            buf = io.BytesIO()
             
-            ReportChartUtils.get_share_performance(
+            ReportChartUtils._plot_share_performance(
                 ticker,
-                datetime.now().strftime("%Y-%m-%d"),
-                tmp_path
+                date.today().isoformat(),
+                buf
             )
             
-            with open(tmp_path, 'rb') as f:
-                img_data = base64.b64encode(f.read()).decode()
-            
-            os.unlink(tmp_path)
+            img_data = _chart_to_b64(buf)
             
             return {
                 "ticker": ticker,
@@ -739,35 +1039,25 @@ class ToolExecutor:
     def _run_backtest(ticker: str, strategy: str, initial_capital: float = 10000, days: int = 365) -> Dict[str, Any]:
         """Run a backtest"""
         try:
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            start_date, end_date = _date_window(days)
             
             # Get strategy string
             strategy_string = STRATEGY_REGISTRY.get(strategy, strategy)
             
             # Default params per strategy
-            params = {}
-            if strategy == "SMA_CrossOver":
-                params = {"fast": 10, "slow": 30}
-            elif strategy == "RSI":
-                params = {"period": 14, "oversold": 30, "overbought": 70}
-            elif strategy == "MACD":
-                params = {"fast_period": 12, "slow_period": 26, "signal_period": 9}
-            elif strategy == "BollingerBands":
-                params = {"period": 20, "devfactor": 2.0}
+            params = _STRATEGY_DEFAULTS.get(strategy)
             
             result = BackTraderUtils.back_test(
                 ticker,
-                start_date.strftime("%Y-%m-%d"),
-                end_date.strftime("%Y-%m-%d"),
+                start_date,
+                end_date,
                 strategy=strategy_string,
-                strategy_params=json.dumps(params) if params else '',
+                strategy_params=json.dumps(dict(params)) if params else '',
                 cash=initial_capital
             )
             
             # Parse result
-            import re
-            final_match = re.search(r"'Final Portfolio Value': ([\d.]+)", result)
+            final_match = _FINAL_VALUE_RE.search(result)
             final_value = float(final_match.group(1)) if final_match else initial_capital
             
             return {
@@ -785,24 +1075,18 @@ class ToolExecutor:
     def _analyze_financials(ticker: str, analysis_type: str, fiscal_year: str = "2024") -> Dict[str, Any]:
         """Run financial analysis"""
         try:
-            with tempfile.NamedTemporaryFile(suffix='.txt', delete=False, mode='w') as tmp:
-                tmp_path = tmp.name
+            content = ""
             
             if analysis_type == "income":
-                ReportAnalysisUtils.analyze_income_stmt(ticker, fiscal_year, tmp_path)
+                content = ReportAnalysisUtils._build_income_stmt_prompt(ticker, fiscal_year)
             elif analysis_type == "balance":
-                ReportAnalysisUtils.analyze_balance_sheet(ticker, fiscal_year, tmp_path)
+                content = ReportAnalysisUtils._build_balance_sheet_prompt(ticker, fiscal_year)
             elif analysis_type == "cashflow":
-                ReportAnalysisUtils.analyze_cash_flow(ticker, fiscal_year, tmp_path)
+                content = ReportAnalysisUtils._build_cash_flow_prompt(ticker, fiscal_year)
             elif analysis_type == "risk":
-                ReportAnalysisUtils.get_risk_assessment(ticker, fiscal_year, tmp_path)
+                content = ReportAnalysisUtils._build_risk_assessment_prompt(ticker, fiscal_year)
             elif analysis_type == "segment":
-                ReportAnalysisUtils.analyze_segment_stmt(ticker, fiscal_year, tmp_path)
-            
-            with open(tmp_path, 'r') as f:
-                content = f.read()
-            
-            os.unlink(tmp_path)
+                content = ReportAnalysisUtils._build_segment_stmt_prompt(ticker, fiscal_year)
             
             return {
                 "ticker": ticker,
@@ -827,13 +1111,20 @@ class ToolExecutor:
     def _compare_stocks(tickers: list, include_chart: bool = True, period_days: int = 365) -> Dict[str, Any]:
         """Compare multiple stocks side-by-side"""
         try:
-            # Get comparison data
-            comparison_data = StockComparator.get_comparison_data(tickers)
-            performance_data = StockComparator.get_price_performance(tickers, period_days)
-            best_in_class = StockComparator.identify_best_in_class(tickers)
+            # Fundamentals and the batched price download are independent, so
+            # fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                comparison_future = executor.submit(StockComparator.get_comparison_data, tickers)
+                performance_future = executor.submit(StockComparator.get_price_performance, tickers, period_days)
+                
+                comparison_data = comparison_future.result()
+                performance_data = performance_future.result()
+            
+            # Ranking and the table reuse the fetched fundamentals
+            best_in_class = StockComparator.identify_best_in_class(tickers, comparison_data)
             
             # Format the comparison table
-            comparison_table = StockComparator.create_comparison_table(tickers)
+            comparison_table = StockComparator.create_comparison_table(tickers, comparison_data)
             
             # Build result
             result = {
@@ -846,18 +1137,11 @@ class ToolExecutor:
             
             # Generate chart if requested
             if include_chart:
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
+                buf = io.BytesIO()
                 
-                ComparisonCharts.performance_comparison_chart(tickers, period_days, tmp_path)
+                ComparisonCharts.performance_comparison_chart(tickers, period_days, buf)
                 
-                with open(tmp_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
-                
-                os.unlink(tmp_path)
-                
-                result["image_base64"] = img_data
-                result["has_image"] = True
+                _attach_chart(result, buf)
             
             return result
             
@@ -868,12 +1152,22 @@ class ToolExecutor:
     def _get_earnings_intel(ticker: str, include_chart: bool = True, quarters: int = 8) -> Dict[str, Any]:
         """Get comprehensive earnings intelligence"""
         try:
-            # Get all earnings data
-            earnings_history = EarningsIntel.get_earnings_history(ticker, quarters)
-            revenue_history = EarningsIntel.get_revenue_history(ticker, quarters)
-            next_earnings = EarningsIntel.get_next_earnings(ticker)
-            analyst_estimates = EarningsIntel.get_analyst_estimates(ticker)
-            streak_analysis = EarningsIntel.get_earnings_surprise_streak(ticker)
+            # Get all earnings data; each lookup is independent I/O
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = (
+                    executor.submit(EarningsIntel.get_earnings_history, ticker, quarters),
+                    executor.submit(EarningsIntel.get_revenue_history, ticker, quarters),
+                    executor.submit(EarningsIntel.get_next_earnings, ticker),
+                    executor.submit(EarningsIntel.get_analyst_estimates, ticker),
+                    executor.submit(EarningsIntel.get_earnings_surprise_streak, ticker),
+                )
+                (
+                    earnings_history,
+                    revenue_history,
+                    next_earnings,
+                    analyst_estimates,
+                    streak_analysis,
+                ) = [future.result() for future in futures]
             
             # Build summary
             summary = earnings_history.get("summary", {})
@@ -895,18 +1189,11 @@ class ToolExecutor:
             
             # Generate chart if requested
             if include_chart:
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
+                buf = io.BytesIO()
                 
-                EarningsCharts.eps_surprise_chart(ticker, quarters, tmp_path)
+                EarningsCharts.eps_surprise_chart(ticker, quarters, buf)
                 
-                with open(tmp_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
-                
-                os.unlink(tmp_path)
-                
-                result["image_base64"] = img_data
-                result["has_image"] = True
+                _attach_chart(result, buf)
             
             return result
             
@@ -923,8 +1210,8 @@ class ToolExecutor:
     ) -> Dict[str, Any]:
         """Manage watchlist and research notes"""
         try:
-            watchlist_mgr = WatchlistManager()
-            research_mgr = ResearchManager()
+            watchlist_mgr = get_watchlist_manager()
+            research_mgr = get_research_manager()
             
             if action == "add":
                 if not ticker:
@@ -933,9 +1220,9 @@ class ToolExecutor:
                 # Get current price if not provided
                 if target_price is None:
                     try:
-                        stock_info = YFinanceUtils.get_stock_info(ticker.upper())
+                        stock_info = YFinanceUtils.get_stock_info(ticker)
                         current_price = stock_info.get("currentPrice") or stock_info.get("regularMarketPrice", 0)
-                    except:
+                    except _FETCH_ERRORS:
                         current_price = None
                 else:
                     current_price = None
@@ -950,8 +1237,8 @@ class ToolExecutor:
                 if result["success"]:
                     return {
                         "action": "added",
-                        "ticker": ticker.upper(),
-                        "message": f"✅ Added {ticker.upper()} to your watchlist",
+                        "ticker": ticker,
+                        "message": f"✅ Added {ticker} to your watchlist",
                         "added_price": current_price,
                         "target_price": target_price,
                         "notes": notes
@@ -966,8 +1253,8 @@ class ToolExecutor:
                 if result["success"]:
                     return {
                         "action": "removed",
-                        "ticker": ticker.upper(),
-                        "message": f"✅ Removed {ticker.upper()} from your watchlist"
+                        "ticker": ticker,
+                        "message": f"✅ Removed {ticker} from your watchlist"
                     }
                 return {"error": result["message"]}
             
@@ -982,8 +1269,7 @@ class ToolExecutor:
                     }
                 
                 # Get current prices for watchlist items
-                watchlist_data = []
-                for item in items:
+                def _fetch_one(item: Dict[str, Any]) -> Dict[str, Any]:
                     ticker = item["ticker"]
                     try:
                         stock_info = YFinanceUtils.get_stock_info(ticker)
@@ -992,7 +1278,7 @@ class ToolExecutor:
                         added_price = item.get("added_price", 0) or 0
                         change_pct = ((current_price - added_price) / added_price * 100) if added_price else 0
                         
-                        watchlist_data.append({
+                        return {
                             "ticker": ticker,
                             "current_price": round(current_price, 2),
                             "added_price": round(added_price, 2) if added_price else None,
@@ -1000,16 +1286,20 @@ class ToolExecutor:
                             "target_price": item.get("target_price"),
                             "notes": item.get("notes"),
                             "added_at": item.get("added_at")
-                        })
-                    except:
-                        watchlist_data.append({
+                        }
+                    except _FETCH_ERRORS:
+                        return {
                             "ticker": ticker,
                             "current_price": None,
                             "added_price": item.get("added_price"),
                             "target_price": item.get("target_price"),
                             "notes": item.get("notes"),
                             "added_at": item.get("added_at")
-                        })
+                        }
+                
+                # Quotes are independent network calls, so fetch them concurrently
+                with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+                    watchlist_data = list(executor.map(_fetch_one, items))
                 
                 return {
                     "action": "list",
@@ -1023,7 +1313,7 @@ class ToolExecutor:
                 if not notes:
                     return {"error": "Notes content is required"}
                 
-                title = note_title or f"Research Note - {ticker.upper()}"
+                title = note_title or f"Research Note - {ticker}"
                 result = research_mgr.save_note(
                     ticker=ticker,
                     title=title,
@@ -1033,8 +1323,8 @@ class ToolExecutor:
                 
                 return {
                     "action": "note_saved",
-                    "ticker": ticker.upper(),
-                    "message": f"📝 Research note saved for {ticker.upper()}",
+                    "ticker": ticker,
+                    "message": f"📝 Research note saved for {ticker}",
                     "title": title
                 }
             
@@ -1046,8 +1336,8 @@ class ToolExecutor:
                 
                 return {
                     "action": "notes_retrieved",
-                    "ticker": ticker.upper(),
-                    "message": f"Found {len(notes_list)} notes for {ticker.upper()}",
+                    "ticker": ticker,
+                    "message": f"Found {len(notes_list)} notes for {ticker}",
                     "notes": notes_list
                 }
             
@@ -1112,7 +1402,7 @@ class ToolExecutor:
             
             # Create summary text for AI to easily relay
             summary_text = f"""
-OWNERSHIP BREAKDOWN FOR {ticker.upper()}:
+OWNERSHIP BREAKDOWN FOR {ticker}:
 - Institutional Ownership: {inst_pct}% ({inst_count:,} institutions)
 - Insider Ownership: {insider_pct}%
 - Public/Retail Ownership: {public_pct}%
@@ -1154,28 +1444,21 @@ TOP 5 INSTITUTIONAL HOLDERS:
             
             # Generate chart if requested
             if include_chart:
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
+                buf = io.BytesIO()
                 
                 if chart_type == "pie":
-                    OwnershipCharts.ownership_pie_chart(ticker, tmp_path)
+                    OwnershipCharts.ownership_pie_chart(ticker, buf)
                 elif chart_type == "holders":
-                    OwnershipCharts.top_holders_chart(ticker, "institutional", 10, tmp_path)
+                    OwnershipCharts.top_holders_chart(ticker, "institutional", 10, buf)
                 elif chart_type == "insider":
-                    OwnershipCharts.insider_activity_chart(ticker, tmp_path)
+                    OwnershipCharts.insider_activity_chart(ticker, buf)
                 elif chart_type == "comparison" and compare_with:
                     all_tickers = [ticker] + compare_with
-                    OwnershipCharts.ownership_comparison_chart(all_tickers, tmp_path)
+                    OwnershipCharts.ownership_comparison_chart(all_tickers, buf)
                 else:
-                    OwnershipCharts.ownership_pie_chart(ticker, tmp_path)
+                    OwnershipCharts.ownership_pie_chart(ticker, buf)
                 
-                with open(tmp_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
-                
-                os.unlink(tmp_path)
-                
-                result["image_base64"] = img_data
-                result["has_image"] = True
+                _attach_chart(result, buf)
             
             return result
             
@@ -1211,7 +1494,7 @@ TOP 5 INSTITUTIONAL HOLDERS:
             
             # Format summary for AI
             summary_text = f"""
-DCF VALUATION FOR {ticker.upper()}
+DCF VALUATION FOR {ticker}
 {'='*50}
 
 COMPANY: {dcf.get('company_name', ticker)}
@@ -1265,25 +1548,18 @@ INVESTMENT VERDICT:
             
             # Generate chart if requested
             if include_chart:
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
+                buf = io.BytesIO()
                 
                 if chart_type == "projection":
-                    DCFCharts.projection_chart(ticker, tmp_path)
+                    DCFCharts.projection_chart(ticker, buf)
                 elif chart_type == "sensitivity":
-                    DCFCharts.sensitivity_heatmap(ticker, tmp_path)
+                    DCFCharts.sensitivity_heatmap(ticker, buf)
                 elif chart_type == "waterfall":
-                    DCFCharts.valuation_waterfall(ticker, tmp_path)
+                    DCFCharts.valuation_waterfall(ticker, buf)
                 else:
-                    DCFCharts.valuation_waterfall(ticker, tmp_path)
-                
-                with open(tmp_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
+                    DCFCharts.valuation_waterfall(ticker, buf)
                 
-                os.unlink(tmp_path)
-                
-                result["image_base64"] = img_data
-                result["has_image"] = True
+                _attach_chart(result, buf)
             
             return result
             
@@ -1321,7 +1597,7 @@ INVESTMENT VERDICT:
             
             # Format summary
             summary_text = f"""
-RISK ANALYSIS FOR {ticker.upper()} ({period} period)
+RISK ANALYSIS FOR {ticker} ({period} period)
 {'='*60}
 
 📊 VALUE AT RISK (95% Confidence, 1-Day):
@@ -1372,35 +1648,44 @@ RISK ANALYSIS FOR {ticker.upper()} ({period} period)
             
             # Generate chart if requested
             if include_chart:
-                with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                    tmp_path = tmp.name
+                buf = io.BytesIO()
                 
                 if chart_type == "var":
-                    RiskCharts.var_distribution_chart(ticker, tmp_path)
+                    RiskCharts.var_distribution_chart(ticker, buf)
                 elif chart_type == "drawdown":
-                    RiskCharts.drawdown_chart(ticker, period, tmp_path)
+                    RiskCharts.drawdown_chart(ticker, period, buf)
                 elif chart_type == "volatility":
-                    RiskCharts.rolling_volatility_chart(ticker, period, 30, tmp_path)
+                    RiskCharts.rolling_volatility_chart(ticker, period, 30, buf)
                 elif chart_type == "correlation" and compare_with:
                     all_tickers = [ticker] + compare_with
-                    RiskCharts.correlation_heatmap(all_tickers, period, tmp_path)
+                    RiskCharts.correlation_heatmap(all_tickers, period, buf)
                 else:
-                    RiskCharts.drawdown_chart(ticker, period, tmp_path)
-                
-                with open(tmp_path, 'rb') as f:
-                    img_data = base64.b64encode(f.read()).decode()
+                    RiskCharts.drawdown_chart(ticker, period, buf)
                 
-                os.unlink(tmp_path)
-                
-                result["image_base64"] = img_data
-                result["has_image"] = True
+                _attach_chart(result, buf)
             
             return result
             
         except Exception as e:
             return {"error": str(e)}
 
-
-# Need pandas for some operations
-import pandas as pd
-
+    # Tool name -> handler, built once when the class body is evaluated
+    _DISPATCH: ClassVar[Dict[str, Callable[..., Dict[str, Any]]]] = {
+        "get_stock_price": _get_stock_price.__func__,
+        "get_income_statement": _get_income_statement.__func__,
+        "get_balance_sheet": _get_balance_sheet.__func__,
+        "get_cash_flow": _get_cash_flow.__func__,
+        "get_company_profile": _get_company_profile.__func__,
+        "get_company_news": _get_company_news.__func__,
+        "create_price_chart": _create_price_chart.__func__,
+        "create_comparison_chart": _create_comparison_chart.__func__,
+        "run_backtest": _run_backtest.__func__,
+        "analyze_financials": _analyze_financials.__func__,
+        "get_basic_financials": _get_basic_financials.__func__,
+        "compare_stocks": _compare_stocks.__func__,
+        "get_earnings_intel": _get_earnings_intel.__func__,
+        "manage_watchlist": _manage_watchlist.__func__,
+        "get_ownership_intel": _get_ownership_intel.__func__,
+        "run_dcf_analysis": _run_dcf_analysis.__func__,
+        "get_risk_analysis": _get_risk_analysis.__func__,
+    }
@@ -1,8 +1,17 @@
 import os
+import copy
 import json
+import time
+import pickle
+import hashlib
+import inspect
+import tempfile
+import threading
 import pandas as pd
+from collections import OrderedDict
 from datetime import date, timedelta, datetime
-from typing import Annotated
+from functools import wraps
+from typing import Annotated, Callable, Dict
 
 
 # Define custom annotated types
@@ -45,6 +54,199 @@ def decorate_all_methods(decorator):
     return class_decorator
 
 
+class DataFetchError(Exception):
+    """Raised when a data-source call fails, whatever the underlying client raised"""
+
+
+# On-disk location of cached data-source responses
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".aurelius", "cache")
+
+# Cache lifetimes in seconds for the different kinds of data-source calls
+PRICE_TTL = 60
+HISTORY_TTL = 10 * 60
+NEWS_TTL = 15 * 60
+FUNDAMENTALS_TTL = 24 * 60 * 60
+PROFILE_TTL = 7 * 24 * 60 * 60
+
+_MEMORY_CACHE_SIZE = 256
+
+
+def _is_cacheable(value) -> bool:
+    if value is None:
+        return False
+    if isinstance(value, pd.DataFrame) and value.empty:
+        return False
+    return True
+
+
+def ttl_cache(
+    ttl: float,
+    endpoint: str,
+    cacheable: Callable = _is_cacheable,
+    cache_dir: str = CACHE_DIR,
+):
+    """
+    Cache a data-source call in memory and under `cache_dir` for `ttl` seconds.
+    The first argument is the ticker symbol and is upper-cased before keying,
+    so "aapl" and "AAPL" share an entry. Calls that pass a save_path are never
+    cached because they are made for their side effect.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        # Least recently used entries are dropped once the size bound is hit;
+        # the lock makes the cache safe to share between threads
+        memory = OrderedDict()
+        lock = threading.Lock()
+        cache_folder = os.path.join(cache_dir, endpoint)
+        signature = inspect.signature(func)
+        takes_save_path = "save_path" in signature.parameters
+
+        def remember(key, saved_at, value):
+            with lock:
+                memory[key] = (saved_at, value)
+                memory.move_to_end(key)
+                while len(memory) > _MEMORY_CACHE_SIZE:
+                    memory.popitem(last=False)
+
+        @wraps(func)
+        def wrapper(symbol, *args, **kwargs):
+            # save_path may be passed by position as well as by keyword
+            if takes_save_path and signature.bind(
+                symbol, *args, **kwargs
+            ).arguments.get("save_path"):
+                return func(symbol, *args, **kwargs)
+
+            key = hashlib.md5(
+                repr((str(symbol).upper(), args, sorted(kwargs.items()))).encode()
+            ).hexdigest()
+            now = time.time()
+
+            with lock:
+                entry = memory.get(key)
+                if entry is not None and now - entry[0] < ttl:
+                    memory.move_to_end(key)
+                    return copy.copy(entry[1])
+
+            cache_path = os.path.join(cache_folder, f"{key}.pkl")
+            try:
+                saved_at = os.path.getmtime(cache_path)
+                if now - saved_at < ttl:
+                    with open(cache_path, "rb") as f:
+                        value = pickle.load(f)
+                    remember(key, saved_at, value)
+                    return copy.copy(value)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+
+            value = func(symbol, *args, **kwargs)
+            if cacheable(value):
+                remember(key, now, value)
+                try:
+                    _dump_pickle(value, cache_path)
+                except (OSError, pickle.PicklingError):
+                    pass
+            return copy.copy(value)
+
+        # Lets callers that cache the call themselves skip this layer
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
+
+
+def chart_cache(ttl: float, endpoint: str, cache_dir: str = CACHE_DIR):
+    """
+    Cache a rendered chart under `cache_dir` for `ttl` seconds, keyed on the
+    call's arguments other than save_path. A hit writes the stored image to
+    save_path (a file path or binary buffer) instead of rendering it again.
+    Directory save paths are rendered as usual, since the function picks the
+    file name.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        cache_folder = os.path.join(cache_dir, endpoint)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            call_args = dict(bound.arguments)
+            save_path = call_args.pop("save_path", None)
+            if save_path is None or (isinstance(save_path, str) and os.path.isdir(save_path)):
+                return func(*args, **kwargs)
+
+            symbol, *rest = call_args.values()
+            key = hashlib.md5(repr((str(symbol).upper(), rest)).encode()).hexdigest()
+            cache_path = os.path.join(cache_folder, f"{key}.pkl")
+            placeholder = "\0"
+
+            try:
+                if time.time() - os.path.getmtime(cache_path) < ttl:
+                    with open(cache_path, "rb") as f:
+                        image, message = pickle.load(f)
+                    _write_image(save_path, image)
+                    return message.replace(placeholder, str(save_path))
+            except (OSError, EOFError, pickle.UnpicklingError):
+                pass
+
+            result = func(*args, **kwargs)
+            try:
+                image = _read_image(save_path)
+                _dump_pickle((image, result.replace(str(save_path), placeholder)), cache_path)
+            except (OSError, pickle.PicklingError):
+                pass
+            return result
+
+        # Lets callers that need every chart rendered skip this layer
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
+
+
+def _dump_pickle(value, cache_path: str) -> None:
+    """Pickle to a temporary file next to cache_path and move it into place, so
+    concurrent readers never load a partly written file"""
+    cache_folder = os.path.dirname(cache_path)
+    os.makedirs(cache_folder, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_folder, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _read_image(save_path) -> bytes:
+    if isinstance(save_path, str):
+        with open(save_path, "rb") as f:
+            return f.read()
+    return save_path.getvalue()
+
+
+def _write_image(save_path, image: bytes) -> None:
+    if isinstance(save_path, str):
+        with open(save_path, "wb") as f:
+            f.write(image)
+    else:
+        save_path.write(image)
+
+
+def cache_methods(ttls: Dict[str, float], cacheable: Callable = _is_cacheable):
+    """Class decorator applying ttl_cache to the named methods"""
+
+    def class_decorator(cls):
+        for attr_name, ttl in ttls.items():
+            endpoint = f"{cls.__name__}.{attr_name}"
+            setattr(cls, attr_name, ttl_cache(ttl, endpoint, cacheable)(cls.__dict__[attr_name]))
+        return cls
+
+    return class_decorator
+
+
 def get_next_weekday(date):
 
     if not isinstance(date, datetime):
@@ -0,0 +1,183 @@
+"""
+AURELIUS - Phase Test Cache
+Keeps data-source responses on disk between runs of the phase testing scripts,
+and holds the helpers those scripts share
+
+Usage (after the sys.path setup in a phase script):
+    from phase_test_cache import enable_test_cache
+    enable_test_cache()
+"""
+
+import io
+import os
+import sys
+import functools
+import contextlib
+import importlib
+
+from aurelius.utils import ttl_cache, _is_cacheable
+
+TEST_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".test_cache")
+
+# Data-source calls the phase scripts make, directly or through the chart and
+# analysis utilities
+CACHED_METHODS = {
+    "YFinanceUtils": [
+        "get_stock_info",
+        "get_stock_data",
+        "get_income_stmt",
+        "get_balance_sheet",
+        "get_cash_flow",
+        "get_analyst_recommendations",
+    ],
+    "SECUtils": ["get_10k_section"],
+    "FMPUtils": [
+        "get_sec_report",
+        "get_financial_metrics",
+        "get_target_price",
+        "get_historical_market_cap",
+        "get_historical_bvps",
+        "get_competitor_financial_metrics",
+    ],
+}
+
+# FMP methods report failures as strings rather than raising
+_FMP_FAILURES = ("Failed to retrieve data", "No data available", "No close date data found")
+
+
+def _is_fmp_result(value) -> bool:
+    if isinstance(value, str) and value.startswith(_FMP_FAILURES):
+        return False
+    return _is_cacheable(value)
+
+
+def _is_sec_report(value) -> bool:
+    # A lookup that found no filing for the year still starts with "Link: "
+    return isinstance(value, str) and value.startswith("Link: ") and not value.startswith("Link: None")
+
+
+def _is_sec_section(value) -> bool:
+    # get_10k_section passes the FMP lookup message through when there is no report
+    return isinstance(value, str) and bool(value) and not value.startswith(_FMP_FAILURES + ("Link: ",))
+
+
+# What may be stored per endpoint; the class name applies to all its methods
+CACHEABLE = {
+    "FMPUtils": _is_fmp_result,
+    "FMPUtils.get_sec_report": _is_sec_report,
+    "SECUtils.get_10k_section": _is_sec_section,
+}
+
+# Module-level functions called directly, e.g. yf.download in BackTraderUtils
+CACHED_FUNCTIONS = {
+    "yfinance": ["download"],
+}
+
+# Chart renderers behind the library's chart cache, which the phase scripts turn
+# off so that every chart check really draws its chart
+UNCACHED_CHARTS = {
+    "aurelius.functional.charting.ReportChartUtils": [
+        "_plot_share_performance",
+        "_plot_pe_eps_performance",
+    ],
+}
+
+_enabled = False
+
+
+def enable_test_cache(ttl_days: float = 7):
+    """
+    Route the data-source calls used by the phase scripts through an on-disk
+    cache, and render charts without the library's chart cache
+    """
+    global _enabled
+    if _enabled:
+        return
+
+    from aurelius import data_source
+
+    for class_name, method_names in CACHED_METHODS.items():
+        cls = getattr(data_source, class_name)
+        for name in method_names:
+            endpoint = f"{class_name}.{name}"
+            cacheable = CACHEABLE.get(endpoint, CACHEABLE.get(class_name, _is_cacheable))
+            # Replace the library's own TTL cache, if it has one, rather than
+            # stacking on it, so each call does a single cache lookup
+            func = getattr(cls, name)
+            cached = ttl_cache(
+                ttl_days * 24 * 60 * 60,
+                endpoint,
+                cacheable,
+                cache_dir=TEST_CACHE_DIR,
+            )(getattr(func, "uncached", func))
+            setattr(cls, name, cached)
+
+    for module_name, function_names in CACHED_FUNCTIONS.items():
+        module = importlib.import_module(module_name)
+        for name in function_names:
+            cached = ttl_cache(
+                ttl_days * 24 * 60 * 60,
+                f"{module_name}.{name}",
+                cache_dir=TEST_CACHE_DIR,
+            )(getattr(module, name))
+            setattr(module, name, cached)
+
+    for path, method_names in UNCACHED_CHARTS.items():
+        module_name, class_name = path.rsplit(".", 1)
+        cls = getattr(importlib.import_module(module_name), class_name)
+        for name in method_names:
+            setattr(cls, name, staticmethod(getattr(cls, name).uncached))
+
+    _enabled = True
+
+
+# Faster rendering for the test charts: simplify long price paths and draw
+# them in chunks. Applied by the chart tests only, so the library's chart
+# defaults are left alone
+FAST_RC = {"path.simplify": True, "path.simplify_threshold": 1.0, "agg.path.chunksize": 10000}
+
+
+def use_fast_rc():
+    import matplotlib
+    matplotlib.rcParams.update(FAST_RC)
+
+
+def warm_matplotlib():
+    """Draw a throwaway figure so forked chart workers inherit a loaded font cache"""
+    from matplotlib import pyplot as plt
+    fig = plt.figure(figsize=(1, 1))
+    fig.text(0.5, 0.5, "0")
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def short_error(e, n=80):
+    """Leading part of an exception message, without stringifying a huge payload"""
+    response = getattr(e, "response", None)
+    status_code = getattr(response, "status_code", None)
+    if status_code is not None:
+        return f"HTTP {status_code}"[:n]
+    message = e.args[0] if e.args else ""
+    return (message if isinstance(message, str) else str(message))[:n]
+
+
+def file_stat(path):
+    """Return (exists, size in bytes) with a single stat call"""
+    try:
+        return True, os.stat(path).st_size
+    except OSError:
+        return False, 0
+
+
+def buffered(test):
+    """Collect a test's output and write it to stdout in one go"""
+    @functools.wraps(test)
+    def wrapper(*args, **kwargs):
+        out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out):
+                return test(*args, **kwargs)
+        finally:
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
+    return wrapper
@@ -0,0 +1,63 @@
+"""
+AURELIUS - Run All Phase Tests
+Runs the phase 1-5 testing scripts in parallel
+
+Run with: python run_all_phases.py
+"""
+
+import io
+import os
+import sys
+import glob
+import runpy
+import contextlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# The phase scripts write to separate output files, so they can overlap; each
+# runs in its own process, so matplotlib state is never shared between them
+PHASE_SCRIPTS = sorted(
+    os.path.basename(path)
+    for path in glob.glob(os.path.join(ROOT, "test_phase[1-5]*.py"))
+)
+
+
+def run_phase(script):
+    """Run one phase script as __main__ and return everything it printed"""
+    os.chdir(ROOT)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        try:
+            runpy.run_path(os.path.join(ROOT, script), run_name="__main__")
+        except SystemExit:
+            pass
+        except Exception as e:
+            print(f"❌ FAIL | {script} crashed: {e}")
+    return output.getvalue()
+
+
+def main():
+    print("\n" + "🏛️ "*20)
+    print("  AURELIUS - Running All Phase Tests")
+    print("🏛️ "*20)
+    for script in PHASE_SCRIPTS:
+        print(f"  {script}")
+
+    # Each phase is network bound; output is printed per phase as it finishes
+    with ProcessPoolExecutor(max_workers=len(PHASE_SCRIPTS)) as executor:
+        futures = {executor.submit(run_phase, script): script for script in PHASE_SCRIPTS}
+        for future in as_completed(futures):
+            print("\n" + "#"*60)
+            print(f"  {futures[future]}")
+            print("#"*60)
+            print(future.result())
+
+    print("\n" + "="*60)
+    print("  All Phase Testing Complete!")
+    print("="*60 + "\n")
+
+
+if __name__ == "__main__":
+    sys.path.insert(0, ROOT)
+    main()
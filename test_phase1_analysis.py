@@ -8,11 +8,18 @@ Run with: python test_phase1_analysis.py
 import os
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Add module to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# aurelius modules pull in yfinance, matplotlib, reportlab etc., so they are
+# imported inside the tests that need them rather than here. Tests that touch
+# the data sources first call enable_test_cache() to reuse responses from
+# earlier runs.
+from phase_test_cache import enable_test_cache, short_error, buffered
+
 # Test configuration
 TEST_TICKER = "AAPL"  # Apple Inc - well-documented, stable data
 TEST_YEAR = "2023"
@@ -23,10 +30,11 @@ OUTPUT_DIR = "test_outputs/phase1"
 # Create output directory
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n  {{}}\n{_BAR}"
+
 def print_header(title):
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
+    print(_HEADER_FMT.format(title))
 
 def print_result(test_name, success, message=""):
     status = "✅ PASS" if success else "❌ FAIL"
@@ -34,6 +42,7 @@ def print_result(test_name, success, message=""):
     if message:
         print(f"       └─ {message}")
 
+@buffered
 def test_api_keys():
     """Test that required API keys are configured"""
     print_header("Testing API Key Configuration")
@@ -60,64 +69,70 @@ def test_api_keys():
     
     return all_present
 
+def _run(name, fn):
+    """Run one check and return (name, ok, message, details) instead of raising"""
+    try:
+        ok, message, *details = fn()
+        return name, ok, message, details
+    except Exception as e:
+        return name, False, short_error(e), []
+
+def run_checks(checks):
+    """Run independent network-bound checks concurrently and print the results in check order"""
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(_run, name, fn) for name, fn in checks]
+        for future in futures:
+            name, ok, message, details = future.result()
+            print_result(name, ok, message)
+            for line in details:
+                print(f"       └─ {line}")
+
+@buffered
 def test_yfinance_utils():
     """Test YFinance utilities"""
     print_header("Testing YFinance Utils")
     
+    enable_test_cache()
     from aurelius.data_source import YFinanceUtils
     
     # Test 1: Get stock info
-    try:
+    def stock_info():
         info = YFinanceUtils.get_stock_info(TEST_TICKER)
-        has_name = "shortName" in info
-        print_result("get_stock_info", has_name, f"Company: {info.get('shortName', 'N/A')}")
-    except Exception as e:
-        print_result("get_stock_info", False, str(e))
+        return "shortName" in info, f"Company: {info.get('shortName', 'N/A')}"
     
     # Test 2: Get stock data
-    try:
+    def stock_data():
         data = YFinanceUtils.get_stock_data(TEST_TICKER, "2024-01-01", "2024-01-31")
-        has_data = len(data) > 0
-        print_result("get_stock_data", has_data, f"Rows: {len(data)}")
-    except Exception as e:
-        print_result("get_stock_data", False, str(e))
-    
-    # Test 3: Get income statement
-    try:
-        income = YFinanceUtils.get_income_stmt(TEST_TICKER)
-        has_data = income is not None and len(income) > 0
-        print_result("get_income_stmt", has_data, f"Shape: {income.shape if has_data else 'N/A'}")
-    except Exception as e:
-        print_result("get_income_stmt", False, str(e))
-    
-    # Test 4: Get balance sheet
-    try:
-        balance = YFinanceUtils.get_balance_sheet(TEST_TICKER)
-        has_data = balance is not None and len(balance) > 0
-        print_result("get_balance_sheet", has_data, f"Shape: {balance.shape if has_data else 'N/A'}")
-    except Exception as e:
-        print_result("get_balance_sheet", False, str(e))
+        return len(data) > 0, f"Rows: {len(data)}"
     
-    # Test 5: Get cash flow
-    try:
-        cash_flow = YFinanceUtils.get_cash_flow(TEST_TICKER)
-        has_data = cash_flow is not None and len(cash_flow) > 0
-        print_result("get_cash_flow", has_data, f"Shape: {cash_flow.shape if has_data else 'N/A'}")
-    except Exception as e:
-        print_result("get_cash_flow", False, str(e))
+    # Tests 3-5: Financial statements
+    def statement(fetch):
+        def check():
+            frame = fetch(TEST_TICKER)
+            has_data = frame is not None and len(frame) > 0
+            return has_data, f"Shape: {frame.shape if has_data else 'N/A'}"
+        return check
     
     # Test 6: Analyst recommendations
-    try:
+    def analyst_recommendations():
         rating, recs = YFinanceUtils.get_analyst_recommendations(TEST_TICKER)
-        has_rating = rating is not None
-        print_result("get_analyst_recommendations", has_rating, f"Rating: {rating}")
-    except Exception as e:
-        print_result("get_analyst_recommendations", False, str(e))
+        return rating is not None, f"Rating: {rating}"
+    
+    run_checks([
+        ("get_stock_info", stock_info),
+        ("get_stock_data", stock_data),
+        ("get_income_stmt", statement(YFinanceUtils.get_income_stmt)),
+        ("get_balance_sheet", statement(YFinanceUtils.get_balance_sheet)),
+        ("get_cash_flow", statement(YFinanceUtils.get_cash_flow)),
+        ("get_analyst_recommendations", analyst_recommendations),
+    ])
 
+@buffered
 def test_sec_utils():
     """Test SEC utilities"""
     print_header("Testing SEC Utils")
     
+    enable_test_cache()
     from aurelius.data_source import SECUtils
     
     sections_to_test = [
@@ -126,151 +141,160 @@ def test_sec_utils():
         (7, "MD&A"),
     ]
     
-    for section_id, section_name in sections_to_test:
-        try:
-            text = SECUtils.get_10k_section(TEST_TICKER, TEST_YEAR, section_id)
-            has_content = text is not None and len(text) > 100
-            preview = text[:100].replace('\n', ' ') + "..." if has_content else "No content"
-            print_result(f"Section {section_id} ({section_name})", has_content, f"Length: {len(text) if text else 0}")
-            if has_content:
-                print(f"       └─ Preview: {preview}")
-        except Exception as e:
-            print_result(f"Section {section_id} ({section_name})", False, str(e)[:80])
+    # Only the length and a short preview of each section are needed
+    def section_check(section_id):
+        def check():
+            length = SECUtils.get_10k_section_length(TEST_TICKER, TEST_YEAR, section_id)
+            if length <= 100:
+                return False, f"Length: {length}"
+            preview = SECUtils.get_10k_section_preview(TEST_TICKER, TEST_YEAR, section_id).replace('\n', ' ')
+            return True, f"Length: {length}", f"Preview: {preview}..."
+        return check
+    
+    run_checks([
+        (f"Section {section_id} ({section_name})", section_check(section_id))
+        for section_id, section_name in sections_to_test
+    ])
 
+@buffered
 def test_fmp_utils():
     """Test FMP utilities"""
     print_header("Testing FMP Utils")
     
+    enable_test_cache()
     from aurelius.data_source import FMPUtils
     
     # Test 1: SEC report URL
-    try:
+    def sec_report():
         result = FMPUtils.get_sec_report(TEST_TICKER, TEST_YEAR)
-        has_result = result is not None
-        print_result("get_sec_report", has_result, str(result)[:80] if result else "No result")
-    except Exception as e:
-        print_result("get_sec_report", False, str(e)[:80])
+        return result is not None, str(result)[:80] if result else "No result"
     
     # Test 2: Financial metrics (may require paid tier)
-    try:
-        metrics = FMPUtils.get_financial_metrics(TEST_TICKER, years=3)
+    def financial_metrics():
+        try:
+            metrics = FMPUtils.get_financial_metrics(TEST_TICKER, years=3)
+        except Exception as e:
+            error_msg = short_error(e, 500)
+            is_paid_issue = "403" in error_msg or "Legacy" in error_msg or "paid" in error_msg.lower()
+            return False, "⚠️  Requires FMP paid tier" if is_paid_issue else short_error(e)
         has_data = metrics is not None and len(metrics) > 0
-        print_result("get_financial_metrics", has_data, f"Shape: {metrics.shape if has_data else 'N/A'}")
-    except Exception as e:
-        error_msg = str(e)
-        is_paid_issue = "403" in error_msg or "Legacy" in error_msg or "paid" in error_msg.lower()
-        if is_paid_issue:
-            print_result("get_financial_metrics", False, "⚠️  Requires FMP paid tier")
-        else:
-            print_result("get_financial_metrics", False, error_msg[:80])
+        return has_data, f"Shape: {metrics.shape if has_data else 'N/A'}"
     
     # Test 3: Target price
-    try:
+    def target_price():
         target = FMPUtils.get_target_price(TEST_TICKER, TEST_FILING_DATE)
-        has_target = target is not None
-        print_result("get_target_price", has_target, f"Target: ${target}" if target else "No target")
-    except Exception as e:
-        print_result("get_target_price", False, str(e)[:80])
+        return target is not None, f"Target: ${target}" if target else "No target"
     
     # Test 4: Historical market cap
-    try:
+    def historical_market_cap():
         market_cap = FMPUtils.get_historical_market_cap(TEST_TICKER, TEST_FILING_DATE)
         has_cap = market_cap is not None and market_cap > 0
         cap_str = f"${market_cap/1e9:.2f}B" if has_cap else "N/A"
-        print_result("get_historical_market_cap", has_cap, f"Market Cap: {cap_str}")
-    except Exception as e:
-        print_result("get_historical_market_cap", False, str(e)[:80])
-
-def test_report_analysis_utils():
-    """Test Report Analysis utilities"""
-    print_header("Testing Report Analysis Utils")
+        return has_cap, f"Market Cap: {cap_str}"
     
+    run_checks([
+        ("get_sec_report", sec_report),
+        ("get_financial_metrics", financial_metrics),
+        ("get_target_price", target_price),
+        ("get_historical_market_cap", historical_market_cap),
+    ])
+
+def _analyze_all(ticker_symbol, fyear, out_dir):
+    """
+    Write the income statement, balance sheet, cash flow and risk assessment
+    analyses into out_dir, fetching the data they share once, up front.
+    Return the saved file path of each analysis.
+    """
+    from aurelius.data_source import YFinanceUtils, SECUtils
     from aurelius.functional.analyzer import ReportAnalysisUtils
     
-    # Test 1: Analyze income statement
-    try:
-        save_path = f"{OUTPUT_DIR}/income_analysis.txt"
-        result = ReportAnalysisUtils.analyze_income_stmt(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("analyze_income_stmt", file_exists, f"Saved to: {save_path}")
-        if file_exists:
-            with open(save_path) as f:
-                content = f.read()
-            print(f"       └─ File size: {len(content)} chars")
-    except Exception as e:
-        print_result("analyze_income_stmt", False, str(e)[:80])
+    analyses = {
+        "income_stmt": (ReportAnalysisUtils.analyze_income_stmt, "income_analysis.txt"),
+        "balance_sheet": (ReportAnalysisUtils.analyze_balance_sheet, "balance_analysis.txt"),
+        "cash_flow": (ReportAnalysisUtils.analyze_cash_flow, "cashflow_analysis.txt"),
+        "risk_assessment": (ReportAnalysisUtils.get_risk_assessment, "risk_assessment.txt"),
+    }
     
-    # Test 2: Analyze balance sheet
-    try:
-        save_path = f"{OUTPUT_DIR}/balance_analysis.txt"
-        result = ReportAnalysisUtils.analyze_balance_sheet(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("analyze_balance_sheet", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        print_result("analyze_balance_sheet", False, str(e)[:80])
+    # Warm the data-source caches so the analyses below don't race to fetch the same data
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        prefetch = [
+            executor.submit(SECUtils.get_10k_sections, ticker_symbol, fyear, [7, "1A"]),
+            executor.submit(YFinanceUtils.get_income_stmt, ticker_symbol),
+            executor.submit(YFinanceUtils.get_balance_sheet, ticker_symbol),
+            executor.submit(YFinanceUtils.get_cash_flow, ticker_symbol),
+            executor.submit(YFinanceUtils.get_stock_info, ticker_symbol),
+        ]
+        for future in prefetch:
+            future.result()
     
-    # Test 3: Analyze cash flow
-    try:
-        save_path = f"{OUTPUT_DIR}/cashflow_analysis.txt"
-        result = ReportAnalysisUtils.analyze_cash_flow(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("analyze_cash_flow", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        print_result("analyze_cash_flow", False, str(e)[:80])
+    os.makedirs(out_dir, exist_ok=True)
+    save_paths = {
+        name: os.path.join(out_dir, filename)
+        for name, (_, filename) in analyses.items()
+    }
+    with ThreadPoolExecutor(max_workers=len(analyses)) as executor:
+        futures = [
+            executor.submit(analyze, ticker_symbol, fyear, save_paths[name])
+            for name, (analyze, _) in analyses.items()
+        ]
+        for future in futures:
+            future.result()
+    return save_paths
+
+@buffered
+def test_report_analysis_utils():
+    """Test Report Analysis utilities"""
+    print_header("Testing Report Analysis Utils")
     
-    # Test 4: Risk assessment
-    try:
-        save_path = f"{OUTPUT_DIR}/risk_assessment.txt"
-        result = ReportAnalysisUtils.get_risk_assessment(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("get_risk_assessment", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        print_result("get_risk_assessment", False, str(e)[:80])
+    enable_test_cache()
+    from aurelius.functional.analyzer import ReportAnalysisUtils
     
-    # Test 5: Business highlights
-    try:
-        save_path = f"{OUTPUT_DIR}/business_highlights.txt"
-        result = ReportAnalysisUtils.analyze_business_highlights(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("analyze_business_highlights", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        print_result("analyze_business_highlights", False, str(e)[:80])
+    # Tests 1-4: Statement and risk analyses, written side by side
+    def all_analyses():
+        save_paths = _analyze_all(TEST_TICKER, TEST_YEAR, OUTPUT_DIR)
+        details = []
+        for name, save_path in save_paths.items():
+            try:
+                details.append(f"{name}: {os.stat(save_path).st_size} bytes")
+            except OSError:
+                return False, f"Missing: {save_path}"
+        return (True, f"Saved to: {OUTPUT_DIR}", *details)
     
-    # Test 6: Company description
-    try:
-        save_path = f"{OUTPUT_DIR}/company_description.txt"
-        result = ReportAnalysisUtils.analyze_company_description(TEST_TICKER, TEST_YEAR, save_path)
-        file_exists = os.path.exists(save_path)
-        print_result("analyze_company_description", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        print_result("analyze_company_description", False, str(e)[:80])
+    # Tests 5-6: Analyses written to the output directory
+    def saved_analysis(analyze, filename):
+        def check():
+            save_path = f"{OUTPUT_DIR}/{filename}"
+            analyze(TEST_TICKER, TEST_YEAR, save_path)
+            return os.path.exists(save_path), f"Saved to: {save_path}"
+        return check
     
     # Test 7: Get key data
-    try:
-        key_data = ReportAnalysisUtils.get_key_data(TEST_TICKER, TEST_FILING_DATE)
-        has_data = key_data is not None and len(key_data) > 0
-        print_result("get_key_data", has_data)
-        if has_data:
-            for k, v in key_data.items():
-                print(f"       └─ {k}: {v}")
-    except Exception as e:
-        print_result("get_key_data", False, str(e)[:80])
+    def key_data():
+        data = ReportAnalysisUtils.get_key_data(TEST_TICKER, TEST_FILING_DATE)
+        has_data = data is not None and len(data) > 0
+        details = [f"{k}: {v}" for k, v in data.items()] if has_data else []
+        return (has_data, "", *details)
     
     # Test 8: Competitors analysis (may fail due to FMP paid tier)
-    try:
+    def competitors_analysis():
         save_path = f"{OUTPUT_DIR}/competitors_analysis.txt"
-        result = ReportAnalysisUtils.get_competitors_analysis(
-            TEST_TICKER, TEST_COMPETITORS, TEST_YEAR, save_path
-        )
-        file_exists = os.path.exists(save_path)
-        print_result("get_competitors_analysis", file_exists, f"Saved to: {save_path}")
-    except Exception as e:
-        error_msg = str(e)
-        is_paid_issue = "403" in error_msg or "Legacy" in error_msg
-        if is_paid_issue:
-            print_result("get_competitors_analysis", False, "⚠️  Requires FMP paid tier")
-        else:
-            print_result("get_competitors_analysis", False, error_msg[:80])
+        try:
+            ReportAnalysisUtils.get_competitors_analysis(
+                TEST_TICKER, TEST_COMPETITORS, TEST_YEAR, save_path
+            )
+        except Exception as e:
+            error_msg = short_error(e, 500)
+            is_paid_issue = "403" in error_msg or "Legacy" in error_msg
+            return False, "⚠️  Requires FMP paid tier" if is_paid_issue else short_error(e)
+        return os.path.exists(save_path), f"Saved to: {save_path}"
+    
+    run_checks([
+        ("statement & risk analyses", all_analyses),
+        ("analyze_business_highlights", saved_analysis(ReportAnalysisUtils.analyze_business_highlights, "business_highlights.txt")),
+        ("analyze_company_description", saved_analysis(ReportAnalysisUtils.analyze_company_description, "company_description.txt")),
+        ("get_key_data", key_data),
+        ("get_competitors_analysis", competitors_analysis),
+    ])
 
 def main():
     print("\n" + "🏛️ "*20)
@@ -291,10 +315,10 @@ def main():
     test_fmp_utils()
     test_report_analysis_utils()
     
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("  Phase 1 Testing Complete!")
     print("  Check test_outputs/phase1/ for generated files")
-    print("="*60 + "\n")
+    print(_BAR + "\n")
 
 if __name__ == "__main__":
     main()
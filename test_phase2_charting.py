@@ -7,10 +7,20 @@ Run with: python test_phase2_charting.py
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Render charts off-screen, including in the chart worker processes
+os.environ.setdefault("MPLBACKEND", "Agg")
 
 # Add module to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# aurelius modules pull in yfinance, matplotlib, reportlab etc., so they are
+# imported inside the tests that need them rather than here. Tests that touch
+# the data sources first call enable_test_cache() to reuse responses from
+# earlier runs.
+from phase_test_cache import enable_test_cache, use_fast_rc, warm_matplotlib, short_error, file_stat, buffered
+
 # Test configuration
 TEST_TICKER = "AAPL"
 OUTPUT_DIR = "test_outputs/phase2"
@@ -18,10 +28,11 @@ OUTPUT_DIR = "test_outputs/phase2"
 # Create output directory
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n  {{}}\n{_BAR}"
+
 def print_header(title):
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
+    print(_HEADER_FMT.format(title))
 
 def print_result(test_name, success, message=""):
     status = "✅ PASS" if success else "❌ FAIL"
@@ -29,11 +40,33 @@ def print_result(test_name, success, message=""):
     if message:
         print(f"       └─ {message}")
 
+def _render_chart(chart_type, chart_name, stock_data, ticker, output_dir):
+    """Draw one mplfinance chart type; runs in a worker process"""
+    from aurelius.functional.charting import MplFinanceUtils
+    use_fast_rc()
+
+    try:
+        save_path = f"{output_dir}/{ticker}_{chart_type}_chart.png"
+        MplFinanceUtils.plot_stock_price_chart_from_df(
+            stock_data,
+            ticker,
+            save_path,
+            type=chart_type
+        )
+        file_exists, file_size = file_stat(save_path)
+        return f"{chart_name} Chart", file_exists, f"Size: {file_size/1024:.1f}KB"
+    except Exception as e:
+        return f"{chart_name} Chart", False, short_error(e)
+
+@buffered
 def test_mplfinance_charting():
     """Test MplFinance charting utilities"""
     print_header("Testing MplFinance Charting")
     
+    enable_test_cache()
     from aurelius.functional.charting import MplFinanceUtils
+    from aurelius.data_source import YFinanceUtils
+    use_fast_rc()
     
     chart_types = [
         ("candle", "Candlestick"),
@@ -41,21 +74,26 @@ def test_mplfinance_charting():
         ("ohlc", "OHLC"),
     ]
     
-    for chart_type, chart_name in chart_types:
-        try:
-            save_path = f"{OUTPUT_DIR}/{TEST_TICKER}_{chart_type}_chart.png"
-            result = MplFinanceUtils.plot_stock_price_chart(
-                TEST_TICKER,
-                "2024-11-01",
-                "2024-12-31",
-                save_path,
-                type=chart_type
+    # The chart types share one price download
+    try:
+        stock_data = YFinanceUtils.get_stock_data(TEST_TICKER, "2024-11-01", "2024-12-31")
+    except Exception as e:
+        stock_data = None
+        print_result("Price data for charts", False, short_error(e))
+    
+    # Rasterizing is CPU bound, so each chart type renders in its own process
+    if stock_data is not None:
+        warm_matplotlib()
+        with ProcessPoolExecutor(max_workers=len(chart_types)) as executor:
+            results = executor.map(
+                _render_chart,
+                *zip(*chart_types),
+                [stock_data] * len(chart_types),
+                [TEST_TICKER] * len(chart_types),
+                [OUTPUT_DIR] * len(chart_types),
             )
-            file_exists = os.path.exists(save_path)
-            file_size = os.path.getsize(save_path) if file_exists else 0
-            print_result(f"{chart_name} Chart", file_exists, f"Size: {file_size/1024:.1f}KB")
-        except Exception as e:
-            print_result(f"{chart_name} Chart", False, str(e)[:80])
+            for result in results:
+                print_result(*result)
     
     # Test with moving averages
     try:
@@ -71,13 +109,16 @@ def test_mplfinance_charting():
         file_exists = os.path.exists(save_path)
         print_result("Line Chart with MA(20,50)", file_exists)
     except Exception as e:
-        print_result("Line Chart with MA(20,50)", False, str(e)[:80])
+        print_result("Line Chart with MA(20,50)", False, short_error(e))
 
+@buffered
 def test_report_chart_utils():
     """Test Report Chart utilities"""
     print_header("Testing Report Chart Utils")
     
+    enable_test_cache()
     from aurelius.functional.charting import ReportChartUtils
+    use_fast_rc()
     
     # Test 1: Share performance vs S&P 500
     try:
@@ -87,11 +128,10 @@ def test_report_chart_utils():
             "2024-12-31",
             save_path
         )
-        file_exists = os.path.exists(save_path)
-        file_size = os.path.getsize(save_path) if file_exists else 0
+        file_exists, file_size = file_stat(save_path)
         print_result("Share Performance vs S&P 500", file_exists, f"Size: {file_size/1024:.1f}KB")
     except Exception as e:
-        print_result("Share Performance vs S&P 500", False, str(e)[:80])
+        print_result("Share Performance vs S&P 500", False, short_error(e))
     
     # Test 2: PE/EPS Performance
     try:
@@ -102,17 +142,18 @@ def test_report_chart_utils():
             years=4,
             save_path=save_path
         )
-        file_exists = os.path.exists(save_path)
-        file_size = os.path.getsize(save_path) if file_exists else 0
+        file_exists, file_size = file_stat(save_path)
         print_result("PE & EPS Performance", file_exists, f"Size: {file_size/1024:.1f}KB")
     except Exception as e:
-        print_result("PE & EPS Performance", False, str(e)[:80])
+        print_result("PE & EPS Performance", False, short_error(e))
 
+@buffered
 def test_backtrader_utils():
     """Test BackTrader utilities"""
     print_header("Testing BackTrader Backtesting")
     
     from aurelius.functional.quantitative import BackTraderUtils
+    use_fast_rc()
     
     # Test 1: SMA Crossover strategy
     try:
@@ -135,7 +176,7 @@ def test_backtrader_utils():
                 if "Final Portfolio Value" in line or "Sharpe Ratio" in line:
                     print(f"       └─ {line.strip()}")
     except Exception as e:
-        print_result("SMA Crossover Backtest", False, str(e)[:80])
+        print_result("SMA Crossover Backtest", False, short_error(e))
 
 def main():
     print("\n" + "📊 "*20)
@@ -151,10 +192,10 @@ def main():
     test_report_chart_utils()
     test_backtrader_utils()
     
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("  Phase 2 Testing Complete!")
     print("  Check test_outputs/phase2/ for generated charts")
-    print("="*60 + "\n")
+    print(_BAR + "\n")
 
 if __name__ == "__main__":
     main()
@@ -8,9 +8,18 @@ Run with: python test_phase3_reports.py
 import os
 import sys
 
+# Render charts off-screen without probing for a GUI backend
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 # Add module to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# aurelius modules pull in yfinance, matplotlib, reportlab etc., so they are
+# imported inside the tests that need them rather than here. Tests that touch
+# the data sources first call enable_test_cache() to reuse responses from
+# earlier runs.
+from phase_test_cache import enable_test_cache, use_fast_rc, short_error, file_stat, buffered
+
 # Test configuration
 TEST_TICKER = "AAPL"
 OUTPUT_DIR = "test_outputs/phase3"
@@ -18,10 +27,11 @@ OUTPUT_DIR = "test_outputs/phase3"
 # Create output directory
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n  {{}}\n{_BAR}"
+
 def print_header(title):
-    print("\n" + "="*60)
-    print(f"  {title}")
-    print("="*60)
+    print(_HEADER_FMT.format(title))
 
 def print_result(test_name, success, message=""):
     status = "✅ PASS" if success else "❌ FAIL"
@@ -29,11 +39,14 @@ def print_result(test_name, success, message=""):
     if message:
         print(f"       └─ {message}")
 
+@buffered
 def test_report_chart_generation():
     """Test generating charts needed for PDF report"""
     print_header("Testing Report Chart Generation")
     
+    enable_test_cache()
     from aurelius.functional.charting import ReportChartUtils
+    use_fast_rc()
     
     # Test 1: Share Performance Chart
     try:
@@ -43,11 +56,10 @@ def test_report_chart_generation():
             "2024-12-31",
             save_path
         )
-        file_exists = os.path.exists(save_path)
-        file_size = os.path.getsize(save_path) if file_exists else 0
+        file_exists, file_size = file_stat(save_path)
         print_result("Share Performance Chart", file_exists, f"Size: {file_size/1024:.1f}KB")
     except Exception as e:
-        print_result("Share Performance Chart", False, str(e)[:80])
+        print_result("Share Performance Chart", False, short_error(e))
     
     # Test 2: PE/EPS Performance Chart
     try:
@@ -58,24 +70,26 @@ def test_report_chart_generation():
             years=4,
             save_path=save_path
         )
-        file_exists = os.path.exists(save_path)
-        file_size = os.path.getsize(save_path) if file_exists else 0
+        file_exists, file_size = file_stat(save_path)
         print_result("PE/EPS Performance Chart", file_exists, f"Size: {file_size/1024:.1f}KB")
     except Exception as e:
-        print_result("PE/EPS Performance Chart", False, str(e)[:80])
+        print_result("PE/EPS Performance Chart", False, short_error(e))
 
+@buffered
 def test_pdf_report_generation():
     """Test PDF report generation (requires charts and AI-generated content)"""
     print_header("Testing PDF Report Generation")
     
+    enable_test_cache()
     from aurelius.functional.reportlab import ReportLabUtils
     
     # Check if we have the required chart files
     share_perf_path = f"{OUTPUT_DIR}/{TEST_TICKER}_share_performance.png"
     pe_eps_path = f"{OUTPUT_DIR}/{TEST_TICKER}_pe_eps.png"
     
-    if not os.path.exists(share_perf_path) or not os.path.exists(pe_eps_path):
-        print_result("PDF Report Generation", False, "Required chart files not found. Run chart tests first.")
+    missing = [path for path in (share_perf_path, pe_eps_path) if not os.path.exists(path)]
+    if missing:
+        print_result("PDF Report Generation", False, f"Missing chart files: {', '.join(missing)}. Run chart tests first.")
         return
     
     # Sample content (in production, this would be AI-generated)
@@ -129,18 +143,18 @@ def test_pdf_report_generation():
         
         # Check if PDF was created
         expected_pdf = f"{OUTPUT_DIR}/{TEST_TICKER}_Equity_Research_report.pdf"
-        pdf_exists = os.path.exists(expected_pdf)
+        pdf_exists, pdf_size = file_stat(expected_pdf)
         
         if pdf_exists:
-            pdf_size = os.path.getsize(expected_pdf)
             print_result("PDF Report Generation", True, f"Size: {pdf_size/1024:.1f}KB")
             print(f"       └─ Report saved to: {expected_pdf}")
         else:
             print_result("PDF Report Generation", False, f"Result: {result[:100]}")
             
     except Exception as e:
-        print_result("PDF Report Generation", False, str(e)[:100])
+        print_result("PDF Report Generation", False, short_error(e, 100))
 
+@buffered
 def test_rag_setup():
     """Test RAG (Retrieval Augmented Generation) setup"""
     print_header("Testing RAG Setup")
@@ -153,7 +167,7 @@ def test_rag_setup():
         print("       └─ Note: Full RAG testing requires documents & OpenAI API")
         
     except Exception as e:
-        print_result("RAG Import", False, str(e)[:80])
+        print_result("RAG Import", False, short_error(e))
 
 def main():
     print("\n" + "📑 "*20)
@@ -169,10 +183,10 @@ def main():
     test_pdf_report_generation()
     test_rag_setup()
     
-    print("\n" + "="*60)
+    print("\n" + _BAR)
     print("  Phase 3 Testing Complete!")
     print("  Check test_outputs/phase3/ for generated files")
-    print("="*60 + "\n")
+    print(_BAR + "\n")
 
 if __name__ == "__main__":
     main()
@@ -9,11 +9,12 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n{{}}\n{_BAR}"
+
 def test_agent_library_loading():
     """Test loading the agent library"""
-    print("\n" + "="*60)
-    print("TEST: Agent Library Loading")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Agent Library Loading"))
     
     try:
         from aurelius.agents.agent_library import library
@@ -32,22 +33,20 @@ def test_agent_library_loading():
 
 def test_agent_profiles():
     """Test that each agent has required fields"""
-    print("\n" + "="*60)
-    print("TEST: Agent Profiles Validation")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Agent Profiles Validation"))
     
     try:
-        from aurelius.agents.agent_library import library
+        from aurelius.agents.agent_manifest import LIBRARY_MANIFEST
         
         required_fields = ['name', 'profile']
         results = {}
         
-        for name, agent in library.items():
+        for name, agent in LIBRARY_MANIFEST.items():
             has_required = all(field in agent for field in required_fields)
-            has_toolkits = 'toolkits' in agent
+            has_toolkits = 'tool_names' in agent
             
             if has_required:
-                toolkit_count = len(agent.get('toolkits', []))
+                toolkit_count = len(agent.get('tool_names', []))
                 results[name] = {
                     'valid': True,
                     'has_tools': has_toolkits,
@@ -74,23 +73,20 @@ def test_agent_profiles():
 
 def test_market_analyst_tools():
     """Test Market Analyst agent's tools"""
-    print("\n" + "="*60)
-    print("TEST: Market Analyst Tools")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Market Analyst Tools"))
     
     try:
-        from aurelius.agents.agent_library import library
+        from aurelius.agents.agent_manifest import LIBRARY_MANIFEST
         
-        market_analyst = library.get('Market_Analyst')
+        market_analyst = LIBRARY_MANIFEST.get('Market_Analyst')
         if not market_analyst:
             print("❌ FAIL | Market_Analyst not found")
             return False
         
-        tools = market_analyst.get('toolkits', [])
+        tools = market_analyst.get('tool_names', [])
         print(f"✅ PASS | Market Analyst has {len(tools)} tools")
         
-        for tool in tools:
-            tool_name = tool.__name__ if hasattr(tool, '__name__') else str(tool)
+        for tool_name in tools:
             print(f"   └─ {tool_name}")
         
         return len(tools) > 0
@@ -103,28 +99,20 @@ def test_market_analyst_tools():
 
 def test_expert_investor_tools():
     """Test Expert Investor agent's tools"""
-    print("\n" + "="*60)
-    print("TEST: Expert Investor Tools")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Expert Investor Tools"))
     
     try:
-        from aurelius.agents.agent_library import library
+        from aurelius.agents.agent_manifest import LIBRARY_MANIFEST
         
-        expert_investor = library.get('Expert_Investor')
+        expert_investor = LIBRARY_MANIFEST.get('Expert_Investor')
         if not expert_investor:
             print("❌ FAIL | Expert_Investor not found")
             return False
         
-        tools = expert_investor.get('toolkits', [])
+        tools = expert_investor.get('tool_names', [])
         print(f"✅ PASS | Expert Investor has {len(tools)} tools")
         
-        for tool in tools:
-            if hasattr(tool, '__name__'):
-                tool_name = tool.__name__
-            elif hasattr(tool, '__class__'):
-                tool_name = tool.__class__.__name__
-            else:
-                tool_name = str(tool)
+        for tool_name in tools:
             print(f"   └─ {tool_name}")
         
         return len(tools) > 0
@@ -137,31 +125,19 @@ def test_expert_investor_tools():
 
 def test_agent_profile_content():
     """Test that agent profiles have meaningful content"""
-    print("\n" + "="*60)
-    print("TEST: Agent Profile Content")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Agent Profile Content"))
     
     try:
-        from aurelius.agents.agent_library import library
+        from aurelius.agents.agent_manifest import LIBRARY_MANIFEST
         
         min_profile_length = 50
-        results = {}
-        
-        for name, agent in library.items():
-            profile = agent.get('profile', '')
-            profile_length = len(profile)
-            is_valid = profile_length >= min_profile_length
-            results[name] = {
-                'length': profile_length,
-                'valid': is_valid
-            }
-        
-        all_valid = all(r['valid'] for r in results.values())
+        lengths = {name: len(agent.get('profile', '')) for name, agent in LIBRARY_MANIFEST.items()}
+        all_valid = all(length >= min_profile_length for length in lengths.values())
         
         print(f"{'✅ PASS' if all_valid else '❌ FAIL'} | Profile Content Check")
-        for name, info in results.items():
-            status = "✓" if info['valid'] else "✗"
-            print(f"   {status} {name}: {info['length']} chars")
+        for name, length in lengths.items():
+            status = "✓" if length >= min_profile_length else "✗"
+            print(f"   {status} {name}: {length} chars")
         
         return all_valid
         
@@ -173,7 +149,7 @@ def test_agent_profile_content():
 
 if __name__ == "__main__":
     print("\n" + "🔬 PHASE 4 TESTING: MULTI-AGENT LIBRARY".center(60))
-    print("=" * 60)
+    print(_BAR)
     
     results = {
         "Agent Library Loading": test_agent_library_loading(),
@@ -183,9 +159,7 @@ if __name__ == "__main__":
         "Agent Profile Content": test_agent_profile_content(),
     }
     
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    print(_HEADER_FMT.format("📊 SUMMARY"))
     
     passed = sum(1 for v in results.values() if v)
     total = len(results)
@@ -195,7 +169,7 @@ if __name__ == "__main__":
         print(f"   {status} | {test}")
     
     print(f"\n   Total: {passed}/{total} tests passed")
-    print("=" * 60)
+    print(_BAR)
     
     if passed == total:
         print("🎉 All Phase 4 Agent tests passed!")
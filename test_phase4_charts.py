@@ -5,142 +5,120 @@ Phase 4 Testing - Additional Chart Types (Renko & Point & Figure)
 
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from aurelius.functional import MplFinanceUtils
+# aurelius modules pull in yfinance, matplotlib etc., so they are imported
+# inside the tests that need them rather than here. Tests that download prices
+# first call enable_test_cache() so the downloads are shared and kept between runs.
+from phase_test_cache import enable_test_cache, warm_matplotlib, short_error, file_stat, buffered
 
 # Test output directory
 OUTPUT_DIR = "test_outputs_phase4"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-def test_renko_chart():
-    """Test Renko chart generation"""
-    print("\n" + "="*60)
-    print("TEST: Renko Chart")
-    print("="*60)
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n{{}}\n{_BAR}"
+
+def _check_chart(name, filename, chart_type, style):
+    """Draw an AAPL 2024 chart and report whether the file was written"""
+    enable_test_cache()
+    from aurelius.functional.charting import MplFinanceUtils
     
     try:
-        save_path = os.path.join(OUTPUT_DIR, "test_renko_AAPL.png")
-        result = MplFinanceUtils.plot_stock_price_chart(
+        save_path = os.path.join(OUTPUT_DIR, filename)
+        MplFinanceUtils.plot_stock_price_chart(
             ticker_symbol="AAPL",
             start_date="2024-01-01",
             end_date="2024-12-31",
             save_path=save_path,
-            type="renko",
-            style="charles"  # Good style for renko
+            type=chart_type,
+            style=style
         )
         
-        if os.path.exists(save_path):
-            file_size = os.path.getsize(save_path)
-            print(f"✅ PASS | Renko Chart")
+        file_exists, file_size = file_stat(save_path)
+        if file_exists:
+            print(f"✅ PASS | {name}")
             print(f"   └─ File: {save_path}")
             print(f"   └─ Size: {file_size:,} bytes")
             return True
         else:
-            print(f"❌ FAIL | Renko Chart - File not created")
+            print(f"❌ FAIL | {name} - File not created")
             return False
             
     except Exception as e:
-        print(f"❌ FAIL | Renko Chart")
+        print(f"❌ FAIL | {name}")
         print(f"   └─ Error: {e}")
         return False
 
 
+@buffered
+def test_renko_chart():
+    """Test Renko chart generation"""
+    print(_HEADER_FMT.format("TEST: Renko Chart"))
+    return _check_chart("Renko Chart", "test_renko_AAPL.png", "renko", "charles")  # Good style for renko
+
+
+@buffered
 def test_pnf_chart():
     """Test Point & Figure chart generation"""
-    print("\n" + "="*60)
-    print("TEST: Point & Figure Chart")
-    print("="*60)
-    
-    try:
-        save_path = os.path.join(OUTPUT_DIR, "test_pnf_AAPL.png")
-        result = MplFinanceUtils.plot_stock_price_chart(
-            ticker_symbol="AAPL",
-            start_date="2024-01-01",
-            end_date="2024-12-31",
-            save_path=save_path,
-            type="pnf",
-            style="charles"
-        )
-        
-        if os.path.exists(save_path):
-            file_size = os.path.getsize(save_path)
-            print(f"✅ PASS | Point & Figure Chart")
-            print(f"   └─ File: {save_path}")
-            print(f"   └─ Size: {file_size:,} bytes")
-            return True
-        else:
-            print(f"❌ FAIL | Point & Figure Chart - File not created")
-            return False
-            
-    except Exception as e:
-        print(f"❌ FAIL | Point & Figure Chart")
-        print(f"   └─ Error: {e}")
-        return False
+    print(_HEADER_FMT.format("TEST: Point & Figure Chart"))
+    return _check_chart("Point & Figure Chart", "test_pnf_AAPL.png", "pnf", "charles")
 
 
+@buffered
 def test_hollow_filled_chart():
     """Test Hollow and Filled candlestick chart"""
-    print("\n" + "="*60)
-    print("TEST: Hollow and Filled Chart")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Hollow and Filled Chart"))
+    return _check_chart("Hollow and Filled Chart", "test_hollow_filled_AAPL.png", "hollow_and_filled", "yahoo")
+
+
+def _render_style(style, stock_data):
+    """Draw one style of the MSFT candle chart; runs in a worker process"""
+    from aurelius.functional.charting import MplFinanceUtils
     
     try:
-        save_path = os.path.join(OUTPUT_DIR, "test_hollow_filled_AAPL.png")
-        result = MplFinanceUtils.plot_stock_price_chart(
-            ticker_symbol="AAPL",
-            start_date="2024-01-01",
-            end_date="2024-12-31",
-            save_path=save_path,
-            type="hollow_and_filled",
-            style="yahoo"
+        save_path = os.path.join(OUTPUT_DIR, f"test_style_{style}.png")
+        MplFinanceUtils.plot_stock_price_chart_from_df(
+            stock_data,
+            "MSFT",
+            save_path,
+            type="candle",
+            style=style
         )
-        
-        if os.path.exists(save_path):
-            file_size = os.path.getsize(save_path)
-            print(f"✅ PASS | Hollow and Filled Chart")
-            print(f"   └─ File: {save_path}")
-            print(f"   └─ Size: {file_size:,} bytes")
-            return True
-        else:
-            print(f"❌ FAIL | Hollow and Filled Chart - File not created")
-            return False
-            
+        return "✅" if os.path.exists(save_path) else "❌"
     except Exception as e:
-        print(f"❌ FAIL | Hollow and Filled Chart")
-        print(f"   └─ Error: {e}")
-        return False
+        return f"❌ ({short_error(e, 30)})"
 
 
+@buffered
 def test_chart_styles():
     """Test different chart styles"""
-    print("\n" + "="*60)
-    print("TEST: Chart Styles")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Chart Styles"))
+    
+    enable_test_cache()
+    from aurelius.data_source import YFinanceUtils
     
     styles = ['default', 'charles', 'yahoo', 'nightclouds', 'sas', 'blueskies', 'mike']
     results = {}
     
-    for style in styles:
-        try:
-            save_path = os.path.join(OUTPUT_DIR, f"test_style_{style}.png")
-            MplFinanceUtils.plot_stock_price_chart(
-                ticker_symbol="MSFT",
-                start_date="2024-06-01",
-                end_date="2024-12-31",
-                save_path=save_path,
-                type="candle",
-                style=style
-            )
-            
-            if os.path.exists(save_path):
-                results[style] = "✅"
-            else:
-                results[style] = "❌"
-        except Exception as e:
-            results[style] = f"❌ ({str(e)[:30]})"
+    # Every style draws the same MSFT history, so it is downloaded once and
+    # handed to the worker processes
+    try:
+        stock_data = YFinanceUtils.get_stock_data("MSFT", "2024-06-01", "2024-12-31")
+    except Exception as e:
+        print(f"❌ FAIL | Chart Styles")
+        print(f"   └─ Error: {e}")
+        return False
+    
+    warm_matplotlib()
+    workers = min(len(styles), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        statuses = executor.map(_render_style, styles, [stock_data] * len(styles))
+        for style, status in zip(styles, statuses):
+            results[style] = status
     
     print("Style Test Results:")
     for style, status in results.items():
@@ -151,7 +129,7 @@ def test_chart_styles():
 
 if __name__ == "__main__":
     print("\n" + "🔬 PHASE 4 TESTING: ADDITIONAL CHART TYPES".center(60))
-    print("=" * 60)
+    print(_BAR)
     
     results = {
         "Renko Chart": test_renko_chart(),
@@ -160,9 +138,7 @@ if __name__ == "__main__":
         "Chart Styles": test_chart_styles(),
     }
     
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    print(_HEADER_FMT.format("📊 SUMMARY"))
     
     passed = sum(1 for v in results.values() if v)
     total = len(results)
@@ -172,7 +148,7 @@ if __name__ == "__main__":
         print(f"   {status} | {test}")
     
     print(f"\n   Total: {passed}/{total} tests passed")
-    print("=" * 60)
+    print(_BAR)
     
     if passed == total:
         print("🎉 All Phase 4 Chart tests passed!")
@@ -9,24 +9,58 @@ import sys
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from aurelius.functional.quantitative import BackTraderUtils
+# aurelius modules pull in yfinance, backtrader etc., so they are imported
+# inside the tests that need them rather than here. Each test first calls
+# enable_test_cache() so price downloads are shared and kept between runs.
+from phase_test_cache import enable_test_cache
 
 # Test output directory
 OUTPUT_DIR = "test_outputs_phase4"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+_BAR = "=" * 60
+_HEADER_FMT = f"\n{_BAR}\n{{}}\n{_BAR}"
+
+START_DATE = "2023-01-01"
+END_DATE = "2024-12-31"
+
+
+def _has_data(ticker, start=START_DATE, end=END_DATE):
+    """Whether the price download the backtest uses came back non-empty"""
+    import yfinance as yf
+    
+    # Same call as BackTraderUtils.back_test, so it shares the cached download
+    # and the backtest makes no extra request
+    try:
+        df = yf.download(ticker, start, end, auto_adjust=True)
+    except Exception:
+        return False
+    return df is not None and not df.empty
+
+
+def _print_head(result, n=5):
+    """Print the first lines of a backtest report (the key metrics), without splitting the rest"""
+    for line in result.split('\n', n)[:n]:
+        print(f"   {line}")
+
+
 def test_sma_crossover():
     """Test SMA Crossover strategy (baseline)"""
-    print("\n" + "="*60)
-    print("TEST: SMA Crossover Strategy")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: SMA Crossover Strategy"))
+    
+    enable_test_cache()
+    from aurelius.functional.quantitative import BackTraderUtils
+    
+    if not _has_data("AAPL"):
+        print(f"⚠️  SKIP | SMA Crossover Strategy - no market data for AAPL")
+        return None
     
     try:
         result = BackTraderUtils.back_test(
             ticker_symbol="AAPL",
-            start_date="2023-01-01",
-            end_date="2024-12-31",
+            start_date=START_DATE,
+            end_date=END_DATE,
             strategy="SMA_CrossOver",
             strategy_params='{"fast": 10, "slow": 30}',
             cash=10000.0
@@ -34,10 +68,7 @@ def test_sma_crossover():
         
         if "Final Portfolio Value" in result:
             print(f"✅ PASS | SMA Crossover Strategy")
-            # Extract key metrics
-            lines = result.split('\n')
-            for line in lines[:5]:
-                print(f"   {line}")
+            _print_head(result)
             return True
         else:
             print(f"❌ FAIL | SMA Crossover Strategy - No results")
@@ -51,15 +82,20 @@ def test_sma_crossover():
 
 def test_rsi_strategy():
     """Test RSI Strategy"""
-    print("\n" + "="*60)
-    print("TEST: RSI Overbought/Oversold Strategy")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: RSI Overbought/Oversold Strategy"))
+    
+    enable_test_cache()
+    from aurelius.functional.quantitative import BackTraderUtils
+    
+    if not _has_data("MSFT"):
+        print(f"⚠️  SKIP | RSI Strategy - no market data for MSFT")
+        return None
     
     try:
         result = BackTraderUtils.back_test(
             ticker_symbol="MSFT",
-            start_date="2023-01-01",
-            end_date="2024-12-31",
+            start_date=START_DATE,
+            end_date=END_DATE,
             strategy="aurelius.functional.strategies:RSI_Strategy",
             strategy_params='{"period": 14, "oversold": 30, "overbought": 70}',
             cash=10000.0
@@ -67,10 +103,7 @@ def test_rsi_strategy():
         
         if "Final Portfolio Value" in result:
             print(f"✅ PASS | RSI Strategy")
-            # Extract key metrics
-            lines = result.split('\n')
-            for line in lines[:5]:
-                print(f"   {line}")
+            _print_head(result)
             return True
         else:
             print(f"❌ FAIL | RSI Strategy - No results")
@@ -84,15 +117,20 @@ def test_rsi_strategy():
 
 def test_macd_strategy():
     """Test MACD Strategy"""
-    print("\n" + "="*60)
-    print("TEST: MACD Crossover Strategy")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: MACD Crossover Strategy"))
+    
+    enable_test_cache()
+    from aurelius.functional.quantitative import BackTraderUtils
+    
+    if not _has_data("GOOGL"):
+        print(f"⚠️  SKIP | MACD Strategy - no market data for GOOGL")
+        return None
     
     try:
         result = BackTraderUtils.back_test(
             ticker_symbol="GOOGL",
-            start_date="2023-01-01",
-            end_date="2024-12-31",
+            start_date=START_DATE,
+            end_date=END_DATE,
             strategy="aurelius.functional.strategies:MACD_Strategy",
             strategy_params='{"fast_period": 12, "slow_period": 26, "signal_period": 9}',
             cash=10000.0
@@ -100,10 +138,7 @@ def test_macd_strategy():
         
         if "Final Portfolio Value" in result:
             print(f"✅ PASS | MACD Strategy")
-            # Extract key metrics
-            lines = result.split('\n')
-            for line in lines[:5]:
-                print(f"   {line}")
+            _print_head(result)
             return True
         else:
             print(f"❌ FAIL | MACD Strategy - No results")
@@ -117,15 +152,20 @@ def test_macd_strategy():
 
 def test_bollinger_strategy():
     """Test Bollinger Bands Strategy"""
-    print("\n" + "="*60)
-    print("TEST: Bollinger Bands Strategy")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Bollinger Bands Strategy"))
+    
+    enable_test_cache()
+    from aurelius.functional.quantitative import BackTraderUtils
+    
+    if not _has_data("NVDA"):
+        print(f"⚠️  SKIP | Bollinger Bands Strategy - no market data for NVDA")
+        return None
     
     try:
         result = BackTraderUtils.back_test(
             ticker_symbol="NVDA",
-            start_date="2023-01-01",
-            end_date="2024-12-31",
+            start_date=START_DATE,
+            end_date=END_DATE,
             strategy="aurelius.functional.strategies:BollingerBands_Strategy",
             strategy_params='{"period": 20, "devfactor": 2.0}',
             cash=10000.0
@@ -133,10 +173,7 @@ def test_bollinger_strategy():
         
         if "Final Portfolio Value" in result:
             print(f"✅ PASS | Bollinger Bands Strategy")
-            # Extract key metrics
-            lines = result.split('\n')
-            for line in lines[:5]:
-                print(f"   {line}")
+            _print_head(result)
             return True
         else:
             print(f"❌ FAIL | Bollinger Bands Strategy - No results")
@@ -150,15 +187,20 @@ def test_bollinger_strategy():
 
 def test_ma_ribbon_strategy():
     """Test Moving Average Ribbon Strategy"""
-    print("\n" + "="*60)
-    print("TEST: Moving Average Ribbon Strategy")
-    print("="*60)
+    print(_HEADER_FMT.format("TEST: Moving Average Ribbon Strategy"))
+    
+    enable_test_cache()
+    from aurelius.functional.quantitative import BackTraderUtils
+    
+    if not _has_data("TSLA"):
+        print(f"⚠️  SKIP | MA Ribbon Strategy - no market data for TSLA")
+        return None
     
     try:
         result = BackTraderUtils.back_test(
             ticker_symbol="TSLA",
-            start_date="2023-01-01",
-            end_date="2024-12-31",
+            start_date=START_DATE,
+            end_date=END_DATE,
             strategy="aurelius.functional.strategies:MovingAverageRibbon_Strategy",
             strategy_params='',
             cash=10000.0
@@ -166,10 +208,7 @@ def test_ma_ribbon_strategy():
         
         if "Final Portfolio Value" in result:
             print(f"✅ PASS | MA Ribbon Strategy")
-            # Extract key metrics
-            lines = result.split('\n')
-            for line in lines[:5]:
-                print(f"   {line}")
+            _print_head(result)
             return True
         else:
             print(f"❌ FAIL | MA Ribbon Strategy - No results")
@@ -183,7 +222,7 @@ def test_ma_ribbon_strategy():
 
 if __name__ == "__main__":
     print("\n" + "🔬 PHASE 4 TESTING: BACKTEST STRATEGIES".center(60))
-    print("=" * 60)
+    print(_BAR)
     
     results = {
         "SMA Crossover (Baseline)": test_sma_crossover(),
@@ -193,22 +232,28 @@ if __name__ == "__main__":
         "MA Ribbon": test_ma_ribbon_strategy(),
     }
     
-    print("\n" + "=" * 60)
-    print("📊 SUMMARY")
-    print("=" * 60)
+    print(_HEADER_FMT.format("📊 SUMMARY"))
     
-    passed = sum(1 for v in results.values() if v)
+    passed = sum(1 for v in results.values() if v is True)
+    skipped = sum(1 for v in results.values() if v is None)
+    failed = sum(1 for v in results.values() if v is False)
     total = len(results)
     
     for test, result in results.items():
-        status = "✅ PASS" if result else "❌ FAIL"
+        if result is True:
+            status = "✅ PASS"
+        elif result is None:
+            status = "⚠️  SKIP"
+        else:
+            status = "❌ FAIL"
         print(f"   {status} | {test}")
     
-    print(f"\n   Total: {passed}/{total} tests passed")
-    print("=" * 60)
+    print(f"\n   Passed: {passed}/{total} | Skipped: {skipped} | Failed: {failed}")
+    print(_BAR)
     
-    if passed == total:
+    if failed == 0 and skipped == 0:
         print("🎉 All Phase 4 Strategy tests passed!")
+    elif failed == 0:
+        print("⚠️  Some tests skipped - no market data returned")
     else:
         print("⚠️  Some tests failed - review output above")
-